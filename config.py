@@ -69,6 +69,7 @@ class Config:
         "timeout": 60,                           # Timeout dalam detik
         "fallback_to_opencv": os.getenv("AI_FALLBACK_OPENCV", "true").lower() == "true",
         "skip_on_failure": os.getenv("AI_SKIP_ON_FAILURE", "false").lower() == "true",
+        "enable_gemini_description": os.getenv("GEMINI_DESCRIPTION_ENABLED", "false").lower() == "true",  # Telemetry deskripsi Gemini (background)
     }
     
     # Auto Crop Settings
@@ -102,6 +103,7 @@ class Config:
         "temp_cleanup": True,                   # Auto cleanup temp files
         "compress_backup": False,               # Jangan compress backup (lebih cepat)
         "memory_limit_mb": 2048,               # Limit memory usage (2GB dari 8GB)
+        "use_opencl": os.getenv("USE_OPENCL", "false").lower() == "true",  # OpenCV T-API (GPU) untuk enhancement
     }
     
     # === LOGGING SETTINGS ===
@@ -23,6 +23,9 @@ class EventSelector:
         self.event_endpoint = Config.WEB_INTEGRATION["web_event_endpoint"]
         self.jwt_secret = Config.WEB_INTEGRATION["jwt_secret"]
         
+        # Satu session untuk semua request: koneksi TCP/TLS ke API dipakai ulang (keep-alive)
+        self.session = requests.Session()
+        
         logger.info("Event selector initialized")
     
     def _create_auth_token(self) -> str:
@@ -59,7 +62,7 @@ class EventSelector:
             headers = self._get_auth_headers()
             
             # Ambil semua event (tidak hanya yang active)
-            response = requests.get(
+            response = self.session.get(
                 self.event_endpoint,
                 headers=headers,
                 params={
@@ -97,7 +100,7 @@ class EventSelector:
             logger.info("Fetching active event...")
             
             headers = self._get_auth_headers()
-            response = requests.get(
+            response = self.session.get(
                 self.event_endpoint,
                 headers=headers,
                 params={"status": "active", "limit": 1},
@@ -334,7 +337,7 @@ class EventSelector:
             }
             
             headers = self._get_auth_headers()
-            response = requests.post(
+            response = self.session.post(
                 self.event_endpoint,
                 headers=headers,
                 json=event_data,
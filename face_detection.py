@@ -113,12 +113,15 @@ class FaceProtectionMask:
         
         return mask
     
-    def apply_face_protection(self, image: np.ndarray) -> Tuple[np.ndarray, np.ndarray, bool]:
+    def apply_face_protection(self, image: np.ndarray,
+                              faces: Optional[List[Tuple[int, int, int, int]]] = None
+                              ) -> Tuple[np.ndarray, np.ndarray, bool]:
         """
         Terapkan proteksi wajah pada gambar
         
         Args:
             image: Input gambar dalam format BGR
+            faces: Hasil detect_faces untuk gambar ini (optional, dideteksi jika None)
             
         Returns:
             Tuple: (masked_image, face_mask, has_faces)
@@ -127,8 +130,9 @@ class FaceProtectionMask:
             - has_faces: Boolean apakah ada wajah terdeteksi
         """
         try:
-            # Deteksi wajah
-            faces = self.detect_faces(image)
+            # Deteksi wajah (skip jika caller sudah punya hasilnya)
+            if faces is None:
+                faces = self.detect_faces(image)
             has_faces = len(faces) > 0
             
             if not has_faces:
@@ -200,18 +204,21 @@ class FaceProtectionMask:
             logger.error(f"Error saat restore area wajah: {e}")
             return enhanced_image
     
-    def visualize_detection(self, image: np.ndarray, output_path: Optional[Path] = None) -> np.ndarray:
+    def visualize_detection(self, image: np.ndarray, output_path: Optional[Path] = None,
+                            faces: Optional[List[Tuple[int, int, int, int]]] = None) -> np.ndarray:
         """
         Visualisasi hasil deteksi wajah untuk debugging
         
         Args:
             image: Input gambar
             output_path: Path untuk save hasil (optional)
+            faces: Hasil detect_faces untuk gambar ini (optional, dideteksi jika None)
             
         Returns:
             Gambar dengan kotak deteksi wajah
         """
-        faces = self.detect_faces(image)
+        if faces is None:
+            faces = self.detect_faces(image)
         result = image.copy()
         
         for (x, y, w, h) in faces:
@@ -243,7 +250,7 @@ def test_face_detection(image_path: str):
         print(f"Terdeteksi {len(faces)} wajah")
         
         # Test masking
-        masked_img, face_mask, has_faces = detector.apply_face_protection(image)
+        masked_img, face_mask, has_faces = detector.apply_face_protection(image, faces)
         print(f"Has faces: {has_faces}")
         
         # Save hasil untuk review
@@ -255,7 +262,7 @@ def test_face_detection(image_path: str):
         cv2.imwrite(str(output_dir / "face_mask.jpg"), face_mask)
         
         # Visualisasi
-        viz = detector.visualize_detection(image, output_dir / "detection_viz.jpg")
+        viz = detector.visualize_detection(image, output_dir / "detection_viz.jpg", faces)
         
         print(f"Hasil test disimpan di: {output_dir}")
         
@@ -32,7 +32,7 @@ def fix_event_selector():
             logger.info("Fetching active event...")
             
             headers = self._get_auth_headers()
-            response = requests.get(
+            response = self.session.get(
                 self.event_endpoint,
                 headers=headers,
                 params={"status": "active", "limit": 1},
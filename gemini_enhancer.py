@@ -7,15 +7,69 @@ import numpy as np
 import base64
 import io
 import logging
+import os
+import queue
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 from pathlib import Path
 from typing import Optional, Tuple
 from config import Config
 from face_detection import FaceProtectionMask
 
+try:
+    from turbojpeg import TurboJPEG, TJSAMP_420
+except ImportError:
+    TurboJPEG = None  # PyTurboJPEG tidak tersedia, pakai cv2.imread
+
 logger = logging.getLogger(__name__)
 
+# Maksimal job deskripsi Gemini (jalan + antri); gambar berikutnya di-skip selama penuh
+_DESCRIPTION_BACKLOG = 2
+
+# Ekstensi gambar yang diproses batch_enhance
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff'})
+
+# Flag decode JPEG tereduksi OpenCV (DCT scaling di libjpeg) per faktor skala
+REDUCED_COLOR_FLAGS = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# Tag EXIF orientation
+EXIF_ORIENTATION_TAG = 0x0112
+
+# Lookup table saturasi (x1.2, saturate ke 255) untuk color enhancement
+SATURATION_LUT = np.clip(np.rint(np.arange(256) * 1.2), 0, 255).astype(np.uint8)
+
+def unsharp_fixed_point(image: np.ndarray, blurred: np.ndarray,
+                        work: Optional[np.ndarray] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Unsharp masking 1.5*image - 0.5*blurred dalam aritmatika integer int16
+    (setara (3*image - blurred + 1) >> 1), tanpa promosi ke float32
+    
+    Args:
+        image: Gambar uint8
+        blurred: Versi blur dari image (uint8)
+        work: Buffer int16 opsional (shape sama) untuk dipakai ulang
+        out: Buffer uint8 opsional (shape sama) untuk hasil
+        
+    Returns:
+        Gambar uint8 yang sudah dipertajam
+    """
+    sharp = np.multiply(image, 3, out=work, dtype=np.int16)
+    sharp -= blurred
+    sharp += 1
+    sharp >>= 1
+    np.clip(sharp, 0, 255, out=sharp)
+    if out is None:
+        return sharp.astype(np.uint8)
+    np.copyto(out, sharp, casting='unsafe')
+    return out
+
 class GeminiImageEnhancer:
     """Class untuk enhancement gambar menggunakan Google Gemini AI"""
     
@@ -29,6 +83,25 @@ class GeminiImageEnhancer:
             # Inisialisasi face protection
             self.face_detector = FaceProtectionMask()
             
+            # Decoder JPEG dengan DCT scaling (opsional)
+            self.jpeg = self._init_turbojpeg()
+            
+            # Deskripsi Gemini (telemetry) jalan di background, tidak memblokir output.
+            # Executor dibuat saat pertama dipakai (lagi setelah close), backlog dibatasi
+            self.description_enabled = Config.AI_ENHANCEMENT["enable_gemini_description"]
+            self.description_executor = None
+            self._description_lock = threading.Lock()
+            self._description_slots = threading.BoundedSemaphore(_DESCRIPTION_BACKLOG)
+            
+            # State per-thread (CLAHE + buffer kerja per shape), aman untuk worker batch_enhance
+            self._thread_state = threading.local()
+            
+            # OpenCL T-API untuk offload enhancement ke GPU (jika diaktifkan dan tersedia)
+            self.use_opencl = Config.PERFORMANCE["use_opencl"] and cv2.ocl.haveOpenCL()
+            if self.use_opencl:
+                cv2.ocl.setUseOpenCL(True)
+                logger.info("OpenCL T-API aktif untuk OpenCV enhancement")
+            
             # Test koneksi
             self._test_connection()
             
@@ -57,22 +130,108 @@ class GeminiImageEnhancer:
             logger.warning(f"Test koneksi Gemini AI gagal: {e}")
             # Tidak raise error, karena mungkin quota/network issue temporary
     
-    def _prepare_image_for_ai(self, image: np.ndarray) -> Image.Image:
+    def _init_turbojpeg(self):
+        """Inisialisasi TurboJPEG jika library tersedia"""
+        if TurboJPEG is None:
+            return None
+        try:
+            return TurboJPEG()
+        except Exception as e:
+            logger.debug(f"TurboJPEG tidak dapat dimuat: {e}")
+            return None
+    
+    def _reduced_decode_factor(self, width: int, height: int) -> int:
         """
-        Persiapkan gambar untuk dikirim ke AI (resize jika perlu)
+        Hitung faktor reduksi decode (1, 2, 4, 8) yang hasilnya masih >= max_resolution
         
         Args:
-            image: OpenCV image (BGR format)
+            width: Lebar gambar asli
+            height: Tinggi gambar asli
+            
+        Returns:
+            Faktor pembagi ukuran gambar
+        """
+        max_res = Config.AI_ENHANCEMENT["max_resolution"]
+        scale = max(width / max_res[0], height / max_res[1])
+        
+        for factor in (8, 4, 2):
+            if factor <= scale:
+                return factor
+        return 1
+    
+    def _read_image(self, image_path: Path, reduced: bool = False) -> Tuple[Optional[np.ndarray], Optional[Tuple[int, int]]]:
+        """
+        Baca gambar, opsional langsung di ukuran tereduksi untuk path AI
+        
+        Args:
+            image_path: Path ke gambar input
+            reduced: Decode JPEG di ukuran kecil via DCT scaling (TurboJPEG atau IMREAD_REDUCED_COLOR_*)
             
         Returns:
-            PIL Image untuk AI processing
+            Tuple: (image BGR, (height, width) ukuran asli)
         """
-        # Konversi BGR ke RGB
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        if reduced and image_path.suffix.lower() in ('.jpg', '.jpeg'):
+            try:
+                # Probe header saja (tanpa decode pixel) untuk ukuran dan orientasi EXIF
+                with Image.open(image_path) as pil_image:
+                    width, height = pil_image.size
+                    orientation = pil_image.getexif().get(EXIF_ORIENTATION_TAG, 1)
+                if orientation in (5, 6, 7, 8):  # Rotasi 90°, ukuran akhir tertukar
+                    width, height = height, width
+                
+                factor = self._reduced_decode_factor(width, height)
+                if factor > 1:
+                    if self.jpeg is not None and orientation == 1:
+                        # TurboJPEG tidak menerapkan orientasi EXIF, jadi hanya untuk orientasi normal
+                        image = self.jpeg.decode(image_path.read_bytes(), scaling_factor=(1, factor))
+                    else:
+                        image = cv2.imread(str(image_path), REDUCED_COLOR_FLAGS[factor])
+                    
+                    if image is not None:
+                        logger.info(f"Decode JPEG 1/{factor}: {width}x{height} -> {image.shape[1]}x{image.shape[0]}")
+                        return image, (height, width)
+            except Exception as e:
+                logger.debug(f"Decode tereduksi gagal, fallback ke decode penuh: {e}")
         
+        image = cv2.imread(str(image_path))
+        if image is None:
+            return None, None
+        return image, image.shape[:2]
+    
+    def _write_image(self, output_path: Path, image: np.ndarray) -> bool:
+        """
+        Simpan gambar hasil enhancement (JPEG quality 95)
+        
+        Args:
+            output_path: Path output
+            image: Gambar BGR
+            
+        Returns:
+            True jika berhasil disimpan
+        """
+        if self.jpeg is not None and output_path.suffix.lower() in ('.jpg', '.jpeg'):
+            try:
+                # Encoder SIMD libjpeg-turbo, subsampling 4:2:0 sama dengan default cv2.imwrite
+                output_path.write_bytes(self.jpeg.encode(image, quality=95, jpeg_subsample=TJSAMP_420))
+                return True
+            except Exception as e:
+                logger.debug(f"Encode TurboJPEG gagal, fallback ke cv2.imwrite: {e}")
+        
+        return cv2.imwrite(str(output_path), image, [cv2.IMWRITE_JPEG_QUALITY, 95])
+    
+    def _downscale_for_ai(self, image: np.ndarray) -> np.ndarray:
+        """
+        Resize gambar ke max_resolution AI jika terlalu besar
+        
+        Args:
+            image: OpenCV image (BGR format)
+            
+        Returns:
+            OpenCV image (BGR format) dengan ukuran <= max_resolution
+        """
         # Resize jika terlalu besar untuk menghemat bandwidth
         max_res = Config.AI_ENHANCEMENT["max_resolution"]
-        height, width = rgb_image.shape[:2]
+        height, width = image.shape[:2]
         
         if width > max_res[0] or height > max_res[1]:
             # Hitung scaling factor sambil maintain aspect ratio
@@ -83,10 +242,10 @@ class GeminiImageEnhancer:
             new_width = int(width * scale)
             new_height = int(height * scale)
             
-            rgb_image = cv2.resize(rgb_image, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4)
+            image = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4)
             logger.info(f"Image direzise dari {width}x{height} ke {new_width}x{new_height}")
         
-        return Image.fromarray(rgb_image)
+        return image
     
     def _create_enhancement_prompt(self, has_faces: bool) -> str:
         """
@@ -120,6 +279,10 @@ class GeminiImageEnhancer:
         - Warna dan saturasi optimal
         """
     
+    def _use_reduced_decode(self, ai_enabled: bool, ai_mode: str) -> bool:
+        """Mode gemini hanya memproses versi downscale (max_resolution), jadi JPEG bisa di-decode kecil"""
+        return ai_enabled and ai_mode == "gemini" and not Config.AI_ENHANCEMENT["skip_on_failure"]
+    
     def enhance_image(self, image_path: Path, output_path: Optional[Path] = None) -> Tuple[bool, Optional[Path]]:
         """
         Enhance gambar menggunakan AI atau fallback method
@@ -142,70 +305,21 @@ class GeminiImageEnhancer:
             logger.info(f"AI Enhancement - Enabled: {ai_enabled}, Mode: {ai_mode}")
             
             # Baca gambar
-            image = cv2.imread(str(image_path))
+            image, original_size = self._read_image(image_path, reduced=self._use_reduced_decode(ai_enabled, ai_mode))
             if image is None:
                 logger.error(f"Gagal membaca gambar: {image_path}")
                 return False, None
             
-            original_image = image.copy()
-            
-            # Deteksi dan proteksi wajah
-            protected_image, face_mask, has_faces = image.copy()
-            face_mask = np.zeros(image.shape[:2], dtype=np.uint8)
-            has_faces = False
-            
-            # Determine enhancement method
-            enhanced_cv = None
-            enhancement_method = "none"
-            
-            if not ai_enabled or ai_mode == "disabled":
-                logger.info("🚫 AI Enhancement disabled - using original image")
-                enhanced_cv = protected_image.copy()
-                enhancement_method = "disabled"
-                
-            elif ai_mode == "opencv":
-                logger.info("🎨 Using OpenCV fallback enhancement only")
-                enhanced_cv = self._opencv_enhancement_only(protected_image)
-                enhancement_method = "opencv"
-                
-            elif ai_mode == "gemini":
-                logger.info("🤖 Using Gemini AI enhancement only")
-                enhanced_cv = self._gemini_enhancement_only(protected_image, has_faces)
-                enhancement_method = "gemini"
-                
-            else:  # ai_mode == "auto"
-                logger.info("🔄 Auto mode - trying Gemini AI with OpenCV fallback")
-                enhanced_cv = self._auto_enhancement(protected_image, has_faces)
-                enhancement_method = "auto"
-            
-            # Fallback jika enhancement gagal
+            enhanced_cv, enhancement_method = self._enhance_loaded(image, original_size, ai_enabled, ai_mode)
             if enhanced_cv is None:
-                if Config.AI_ENHANCEMENT["skip_on_failure"]:
-                    logger.warning("⏭️ Enhancement failed, skipping (skip_on_failure=true)")
-                    enhanced_cv = protected_image.copy()
-                    enhancement_method = "skipped"
-                else:
-                    logger.error("❌ All enhancement methods failed")
-                    return False, None
-            
-            # Resize kembali ke ukuran original jika diperlukan
-            if enhanced_cv.shape[:2] != original_image.shape[:2]:
-                enhanced_cv = cv2.resize(enhanced_cv, 
-                                       (original_image.shape[1], original_image.shape[0]), 
-                                       interpolation=cv2.INTER_LANCZOS4)
-            
-            # Restore area wajah jika ada (kecuali jika disabled)
-            if has_faces and enhancement_method != "disabled":
-                enhanced_cv = self.face_detector.restore_face_areas(enhanced_cv, original_image, face_mask)
-                logger.info("Area wajah berhasil di-restore")
+                return False, None
             
             # Tentukan output path
             if output_path is None:
                 output_path = Config.TEMP_DIR / f"enhanced_{image_path.stem}.jpg"
             
             # Simpan hasil
-            success = cv2.imwrite(str(output_path), enhanced_cv, 
-                                [cv2.IMWRITE_JPEG_QUALITY, 95])
+            success = self._write_image(output_path, enhanced_cv)
             
             if success:
                 processing_time = time.time() - start_time
@@ -219,92 +333,170 @@ class GeminiImageEnhancer:
             logger.error(f"Error saat enhancement gambar: {e}")
             return False, None
     
-    def _enhance_with_retry(self, image: Image.Image, prompt: str) -> Optional[Image.Image]:
+    def _enhance_loaded(self, image: np.ndarray, original_size: Tuple[int, int],
+                        ai_enabled: bool, ai_mode: str) -> Tuple[Optional[np.ndarray], str]:
+        """
+        Enhance gambar yang sudah dibaca ke memory
+        
+        Args:
+            image: Input image (BGR format)
+            original_size: (height, width) ukuran asli gambar
+            ai_enabled: Apakah AI enhancement aktif
+            ai_mode: Mode enhancement (auto | gemini | opencv | disabled)
+            
+        Returns:
+            Tuple: (enhanced image atau None jika gagal, enhancement method)
+        """
+        # Deteksi wajah belum diaktifkan di pipeline ini: tanpa restore area wajah,
+        # sehingga input tidak perlu disalin (pipeline tidak memodifikasi in-place)
+        protected_image = image
+        has_faces = False
+        
+        # Determine enhancement method
+        enhanced_cv = None
+        enhancement_method = "none"
+        
+        if not ai_enabled or ai_mode == "disabled":
+            logger.info("🚫 AI Enhancement disabled - using original image")
+            enhanced_cv = protected_image.copy()
+            enhancement_method = "disabled"
+            
+        elif ai_mode == "opencv":
+            logger.info("🎨 Using OpenCV fallback enhancement only")
+            enhanced_cv = self._opencv_enhancement_only(protected_image)
+            enhancement_method = "opencv"
+            
+        elif ai_mode == "gemini":
+            logger.info("🤖 Using Gemini AI enhancement only")
+            enhanced_cv = self._gemini_enhancement_only(protected_image, has_faces)
+            enhancement_method = "gemini"
+            
+        else:  # ai_mode == "auto"
+            logger.info("🔄 Auto mode - trying Gemini AI with OpenCV fallback")
+            enhanced_cv = self._auto_enhancement(protected_image, has_faces)
+            enhancement_method = "auto"
+        
+        # Fallback jika enhancement gagal
+        if enhanced_cv is None:
+            if Config.AI_ENHANCEMENT["skip_on_failure"]:
+                logger.warning("⏭️ Enhancement failed, skipping (skip_on_failure=true)")
+                enhanced_cv = protected_image.copy()
+                enhancement_method = "skipped"
+            else:
+                logger.error("❌ All enhancement methods failed")
+                return None, enhancement_method
+        
+        # Resize kembali ke ukuran original jika diperlukan (hanya path AI yang downscale).
+        # INTER_CUBIC cukup karena detail frekuensi tinggi sudah hilang saat downscale
+        if ai_mode != "opencv" and enhanced_cv.shape[:2] != original_size:
+            enhanced_cv = cv2.resize(enhanced_cv, 
+                                     (original_size[1], original_size[0]), 
+                                     interpolation=cv2.INTER_CUBIC)
+        
+        return enhanced_cv, enhancement_method
+    
+    def _describe_with_retry(self, image: Image.Image, prompt: str) -> Optional[str]:
         """
-        Enhancement dengan retry mechanism
+        Minta deskripsi enhancement dari Gemini dengan retry mechanism
         
         Args:
             image: PIL Image
             prompt: Enhancement prompt
             
         Returns:
-            Enhanced PIL Image atau None jika gagal
+            Teks response Gemini atau None jika gagal
         """
         retry_attempts = Config.AI_ENHANCEMENT["retry_attempts"]
-        timeout = Config.AI_ENHANCEMENT["timeout"]
         
         for attempt in range(retry_attempts):
             try:
-                logger.info(f"Mencoba enhancement (attempt {attempt + 1}/{retry_attempts})")
+                logger.info(f"Meminta deskripsi Gemini (attempt {attempt + 1}/{retry_attempts})")
                 
-                # Kirim request ke Gemini
                 response = self.model.generate_content([prompt, image])
-                
-                # Gemini tidak langsung return image, jadi kita perlu handling khusus
-                # Untuk sekarang, kita implementasikan workaround dengan prompt yang meminta deskripsi enhancement
-                enhanced_description = response.text
-                logger.info(f"Gemini response: {enhanced_description[:100]}...")
-                
-                # CATATAN: Implementasi ini adalah placeholder
-                # Google Gemini saat ini belum support direct image generation/enhancement
-                # Kita perlu menggunakan alternatif atau menunggu update API
-                
-                # Untuk sekarang, return image enhancement menggunakan OpenCV sebagai fallback
-                return self._fallback_enhancement(image)
+                description = response.text
+                logger.info(f"Gemini response: {description[:100]}...")
+                return description
                 
             except Exception as e:
                 logger.warning(f"Attempt {attempt + 1} gagal: {e}")
                 if attempt < retry_attempts - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
                 else:
-                    logger.error("Semua attempt enhancement gagal")
-                    return None
+                    logger.error("Semua attempt deskripsi Gemini gagal")
         
         return None
     
-    def _fallback_enhancement(self, image: Image.Image) -> Image.Image:
+    def _submit_description(self, ai_image: np.ndarray, has_faces: bool):
         """
-        Fallback enhancement menggunakan OpenCV ketika Gemini tidak tersedia
+        Jadwalkan deskripsi Gemini di background, di-skip jika backlog penuh
+        (tiap job memegang salinan PIL gambar dan bisa berjalan beberapa detik)
         
         Args:
-            image: PIL Image
-            
-        Returns:
-            Enhanced PIL Image
+            ai_image: Gambar hasil downscale untuk AI (BGR format)
+            has_faces: Apakah ada wajah dalam gambar
         """
-        logger.info("Menggunakan fallback enhancement dengan OpenCV")
-        
-        # Konversi ke OpenCV
-        cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+        if not self._description_slots.acquire(blocking=False):
+            logger.debug("Backlog deskripsi Gemini penuh, skip gambar ini")
+            return
         
-        # Enhancement menggunakan teknik tradisional
-        enhanced = cv_image.copy()
+        try:
+            pil_image = Image.fromarray(cv2.cvtColor(ai_image, cv2.COLOR_BGR2RGB))
+            prompt = self._create_enhancement_prompt(has_faces)
+            with self._description_lock:
+                if self.description_executor is None:
+                    self.description_executor = ThreadPoolExecutor(max_workers=1)
+                future = self.description_executor.submit(self._describe_with_retry, pil_image, prompt)
+        except Exception:
+            self._description_slots.release()
+            raise
         
-        # 1. Unsharp masking untuk ketajaman
-        gaussian = cv2.GaussianBlur(enhanced, (0, 0), 2.0)
-        enhanced = cv2.addWeighted(enhanced, 1.5, gaussian, -0.5, 0)
+        # Selesai atau dibatalkan (close) -> slot kembali
+        future.add_done_callback(lambda _: self._description_slots.release())
+    
+    def close(self):
+        """Hentikan executor deskripsi Gemini tanpa menunggu; job yang masih antri dibatalkan"""
+        with self._description_lock:
+            executor, self.description_executor = self.description_executor, None
+        if executor is None:
+            return
         
-        # 2. CLAHE untuk kontras adaptif
-        lab = cv2.cvtColor(enhanced, cv2.COLOR_BGR2LAB)
-        l, a, b = cv2.split(lab)
-        clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-        l = clahe.apply(l)
-        enhanced = cv2.merge([l, a, b])
-        enhanced = cv2.cvtColor(enhanced, cv2.COLOR_LAB2BGR)
+        if sys.version_info >= (3, 9):
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:  # cancel_futures baru ada di Python 3.9
+            executor.shutdown(wait=False)
+    
+    def _clahe(self):
+        """CLAHE per-thread (objek CLAHE OpenCV menyimpan buffer internal, tidak thread-safe)"""
+        clahe = getattr(self._thread_state, "clahe", None)
+        if clahe is None:
+            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
+            self._thread_state.clahe = clahe
+        return clahe
+    
+    def _work_buffers(self, shape: Tuple[int, ...]) -> dict:
+        """
+        Buffer kerja pipeline OpenCV yang dispesialisasi per shape gambar.
+        Foto dari kamera yang sama punya ukuran sama, jadi mulai gambar kedua
+        tidak ada alokasi ulang untuk buffer intermediate.
         
-        # 3. Noise reduction
-        enhanced = cv2.bilateralFilter(enhanced, 9, 75, 75)
+        Args:
+            shape: Shape gambar (height, width, channels)
+            
+        Returns:
+            Dict buffer: sharp16 (int16), sharp, lab, hsv (uint8)
+        """
+        cached = getattr(self._thread_state, "buffers", None)
+        if cached is not None and cached[0] == shape:
+            return cached[1]
         
-        # 4. Color enhancement
-        hsv = cv2.cvtColor(enhanced, cv2.COLOR_BGR2HSV)
-        h, s, v = cv2.split(hsv)
-        s = cv2.multiply(s, 1.2)  # Increase saturation slightly
-        enhanced = cv2.merge([h, s, v])
-        enhanced = cv2.cvtColor(enhanced, cv2.COLOR_HSV2BGR)
-        
-        # Konversi kembali ke PIL
-        enhanced_rgb = cv2.cvtColor(enhanced, cv2.COLOR_BGR2RGB)
-        return Image.fromarray(enhanced_rgb)
+        buffers = {
+            "sharp16": np.empty(shape, dtype=np.int16),
+            "sharp": np.empty(shape, dtype=np.uint8),
+            "lab": np.empty(shape, dtype=np.uint8),
+            "hsv": np.empty(shape, dtype=np.uint8),
+        }
+        self._thread_state.buffers = (shape, buffers)
+        return buffers
     
     def _opencv_enhancement_only(self, image: np.ndarray) -> Optional[np.ndarray]:
         """
@@ -319,29 +511,29 @@ class GeminiImageEnhancer:
         try:
             logger.info("🎨 Applying OpenCV-only enhancement...")
             
-            enhanced = image.copy()
+            if self.use_opencl:
+                enhanced = self._opencv_enhancement_umat(image)
+                logger.info("✅ OpenCV enhancement completed (OpenCL)")
+                return enhanced
             
-            # 1. Unsharp masking untuk ketajaman
-            gaussian = cv2.GaussianBlur(enhanced, (0, 0), 2.0)
-            enhanced = cv2.addWeighted(enhanced, 1.5, gaussian, -0.5, 0)
+            buffers = self._work_buffers(image.shape)
             
-            # 2. CLAHE untuk kontras adaptif
-            lab = cv2.cvtColor(enhanced, cv2.COLOR_BGR2LAB)
-            l, a, b = cv2.split(lab)
-            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-            l = clahe.apply(l)
-            enhanced = cv2.merge([l, a, b])
-            enhanced = cv2.cvtColor(enhanced, cv2.COLOR_LAB2BGR)
+            # 1. Unsharp masking untuk ketajaman (input tidak dimodifikasi, tanpa copy)
+            gaussian = cv2.GaussianBlur(image, (0, 0), 2.0)
+            sharp = unsharp_fixed_point(image, gaussian, buffers["sharp16"], buffers["sharp"])
             
-            # 3. Noise reduction
-            enhanced = cv2.bilateralFilter(enhanced, 9, 75, 75)
+            # 2. CLAHE untuk kontras adaptif, hanya channel L yang diproses
+            lab = cv2.cvtColor(sharp, cv2.COLOR_BGR2LAB, dst=buffers["lab"])
+            lab[:, :, 0] = self._clahe().apply(cv2.extractChannel(lab, 0))
+            cv2.cvtColor(lab, cv2.COLOR_LAB2BGR, dst=sharp)
             
-            # 4. Color enhancement
-            hsv = cv2.cvtColor(enhanced, cv2.COLOR_BGR2HSV)
-            h, s, v = cv2.split(hsv)
-            s = cv2.multiply(s, 1.2)  # Increase saturation slightly
-            enhanced = cv2.merge([h, s, v])
-            enhanced = cv2.cvtColor(enhanced, cv2.COLOR_HSV2BGR)
+            # 3. Noise reduction (output baru, buffer kerja tidak ikut dikembalikan)
+            enhanced = cv2.bilateralFilter(sharp, 9, 75, 75)
+            
+            # 4. Color enhancement: saturasi x1.2 via lookup table, tanpa split/merge
+            hsv = cv2.cvtColor(enhanced, cv2.COLOR_BGR2HSV, dst=buffers["hsv"])
+            hsv[:, :, 1] = cv2.LUT(cv2.extractChannel(hsv, 1), SATURATION_LUT)
+            cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR, dst=enhanced)
             
             logger.info("✅ OpenCV enhancement completed")
             return enhanced
@@ -350,6 +542,37 @@ class GeminiImageEnhancer:
             logger.error(f"Error in OpenCV enhancement: {e}")
             return None
     
+    def _opencv_enhancement_umat(self, image: np.ndarray) -> np.ndarray:
+        """
+        Pipeline enhancement yang sama dengan _opencv_enhancement_only via OpenCL T-API.
+        Gambar di-upload sekali sebagai UMat dan di-download sekali di akhir.
+        
+        Args:
+            image: Input image (BGR format)
+            
+        Returns:
+            Enhanced image
+        """
+        src = cv2.UMat(image)
+        
+        # 1. Unsharp masking
+        gaussian = cv2.GaussianBlur(src, (0, 0), 2.0)
+        enhanced = cv2.addWeighted(src, 1.5, gaussian, -0.5, 0)
+        
+        # 2. CLAHE pada channel L
+        l, a, b = cv2.split(cv2.cvtColor(enhanced, cv2.COLOR_BGR2LAB))
+        enhanced = cv2.cvtColor(cv2.merge([self._clahe().apply(l), a, b]), cv2.COLOR_LAB2BGR)
+        
+        # 3. Noise reduction
+        enhanced = cv2.bilateralFilter(enhanced, 9, 75, 75)
+        
+        # 4. Color enhancement
+        h, s, v = cv2.split(cv2.cvtColor(enhanced, cv2.COLOR_BGR2HSV))
+        s = cv2.LUT(s, SATURATION_LUT)
+        enhanced = cv2.cvtColor(cv2.merge([h, s, v]), cv2.COLOR_HSV2BGR)
+        
+        return enhanced.get()
+    
     def _gemini_enhancement_only(self, image: np.ndarray, has_faces: bool) -> Optional[np.ndarray]:
         """
         Enhancement menggunakan Gemini AI saja (tanpa fallback)
@@ -365,21 +588,22 @@ class GeminiImageEnhancer:
             logger.info("🤖 Applying Gemini AI enhancement only...")
             
             # Persiapkan gambar untuk AI
-            pil_image = self._prepare_image_for_ai(image)
+            ai_image = self._downscale_for_ai(image)
             
-            # Buat prompt berdasarkan deteksi wajah
-            prompt = self._create_enhancement_prompt(has_faces)
+            # Gemini belum support direct image generation/enhancement, jadi hasil
+            # akhir selalu dari pipeline OpenCV. Deskripsi Gemini opsional dan
+            # berjalan paralel di background.
+            if self.description_enabled:
+                self._submit_description(ai_image, has_faces)
+            else:
+                logger.info("Gemini image generation belum didukung - langsung pakai pipeline OpenCV")
             
-            # Enhancement menggunakan Gemini AI
-            enhanced_pil = self._enhance_with_retry(pil_image, prompt)
+            enhanced_cv = self._opencv_enhancement_only(ai_image)
             
-            if enhanced_pil is None:
+            if enhanced_cv is None:
                 logger.error("Gemini AI enhancement failed")
                 return None
             
-            # Konversi hasil ke OpenCV format
-            enhanced_cv = cv2.cvtColor(np.array(enhanced_pil), cv2.COLOR_RGB2BGR)
-            
             logger.info("✅ Gemini AI enhancement completed")
             return enhanced_cv
             
@@ -440,30 +664,95 @@ class GeminiImageEnhancer:
         """
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']
-        image_files = []
+        # Satu kali scan direktori, filter ekstensi (case-insensitive) via set
+        with os.scandir(input_dir) as entries:
+            image_files = [Path(entry.path) for entry in entries
+                           if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS]
         
-        for ext in image_extensions:
-            image_files.extend(input_dir.glob(f"*{ext}"))
-            image_files.extend(input_dir.glob(f"*{ext.upper()}"))
+        ai_enabled = Config.AI_ENHANCEMENT["enabled"]
+        ai_mode = Config.AI_ENHANCEMENT["mode"]
+        reduced_decode = self._use_reduced_decode(ai_enabled, ai_mode)
         
-        success_count = 0
+        # Pipeline 3 tahap: reader (decode) -> workers (enhance) -> writer (encode).
+        # Queue dibatasi supaya jumlah gambar di memory tetap kecil.
+        num_workers = Config.PERFORMANCE["max_workers"]
+        read_queue = queue.Queue(maxsize=num_workers * 2)
+        write_queue = queue.Queue(maxsize=num_workers * 2)
+        results = []
         
-        for image_file in image_files:
-            output_file = output_dir / f"enhanced_{image_file.name}"
-            success, _ = self.enhance_image(image_file, output_file)
-            
-            if success:
-                success_count += 1
-                logger.info(f"✅ {image_file.name}")
-            else:
-                logger.error(f"❌ {image_file.name}")
+        def reader():
+            try:
+                for image_file in image_files:
+                    image, original_size = self._read_image(image_file, reduced=reduced_decode)
+                    read_queue.put((image_file, image, original_size))
+            finally:
+                for _ in range(num_workers):
+                    read_queue.put(None)
+        
+        def worker():
+            while True:
+                item = read_queue.get()
+                if item is None:
+                    break
+                
+                image_file, image, original_size = item
+                enhanced_cv = None
+                if image is None:
+                    logger.error(f"Gagal membaca gambar: {image_file}")
+                else:
+                    try:
+                        enhanced_cv, _ = self._enhance_loaded(image, original_size, ai_enabled, ai_mode)
+                    except Exception as e:
+                        logger.error(f"Error saat enhancement gambar {image_file}: {e}")
+                write_queue.put((image_file, enhanced_cv))
+        
+        def writer():
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    break
+                
+                image_file, enhanced_cv = item
+                output_file = output_dir / f"enhanced_{image_file.name}"
+                try:
+                    success = enhanced_cv is not None and self._write_image(output_file, enhanced_cv)
+                except Exception as e:
+                    logger.error(f"Gagal menyimpan gambar {output_file}: {e}")
+                    success = False
+                
+                results.append(success)
+                if success:
+                    logger.info(f"✅ {image_file.name}")
+                else:
+                    logger.error(f"❌ {image_file.name}")
+        
+        reader_thread = threading.Thread(target=reader, name="enhance-reader", daemon=True)
+        worker_threads = [threading.Thread(target=worker, name=f"enhance-worker-{n}", daemon=True)
+                          for n in range(num_workers)]
+        writer_thread = threading.Thread(target=writer, name="enhance-writer", daemon=True)
+        
+        writer_thread.start()
+        for thread in worker_threads:
+            thread.start()
+        reader_thread.start()
+        
+        reader_thread.join()
+        for thread in worker_threads:
+            thread.join()
+        write_queue.put(None)
+        writer_thread.join()
+        
+        success_count = sum(results)
+        
+        # Deskripsi yang belum jalan tidak ditunggu (exit interpreter tidak tertahan telemetry)
+        self.close()
         
         logger.info(f"Batch enhancement selesai: {success_count}/{len(image_files)} berhasil")
         return success_count
 
 def test_enhancement():
     """Test function untuk enhancement"""
+    enhancer = None
     try:
         enhancer = GeminiImageEnhancer()
         
@@ -485,6 +774,9 @@ def test_enhancement():
             
     except Exception as e:
         print(f"Error during test: {e}")
+    finally:
+        if enhancer is not None:
+            enhancer.close()
 
 if __name__ == "__main__":
     test_enhancement()
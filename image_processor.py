@@ -4,23 +4,115 @@
 import cv2
 import numpy as np
 import logging
+import os
+import re
+import tempfile
+import threading
+import time
 from PIL import Image, ImageDraw
 from pathlib import Path
 from typing import Tuple, Optional
 import colour
 from config import Config
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None  # numba tidak tersedia, pakai cv2.remap
+
 logger = logging.getLogger(__name__)
 
+# Pola parsing file .cube
+LUT_3D_SIZE_PATTERN = re.compile(r'^\s*LUT_3D_SIZE\s+(\d+)', re.MULTILINE)
+CUBE_HEADER_PATTERN = re.compile(r'^[ \t]*[#A-Za-z_].*$', re.MULTILINE)
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _interpolate_lut_numba(img, lut, n, out):
+        """
+        Trilinear LUT per pixel dalam fixed-point: img uint8 HxWx3,
+        lut uint16 Q8.8 flat (N^3, 3), out uint8 HxWx3. Fraksi koordinat Q0.8 (0-256),
+        lerp (a * (256 - f) + b * f + 128) >> 8 sehingga semua intermediate tetap Q8.8.
+        Koordinat, lerp, dan output dibulatkan (bukan dipotong) agar LUT identity
+        memetakan tiap level 0-255 ke dirinya sendiri.
+        8 sudut diambil dari satu index linear base + offset konstan.
+        """
+        height, width = img.shape[0], img.shape[1]
+        scale = (n - 1) * 256
+        step_g = n
+        step_r = n * n
+        
+        for y in prange(height):
+            for x in range(width):
+                # Koordinat LUT Q.8: round(v * (n - 1) / 255)
+                cr = (img[y, x, 0] * scale + 127) // 255
+                cg = (img[y, x, 1] * scale + 127) // 255
+                cb = (img[y, x, 2] * scale + 127) // 255
+                ir = min(cr >> 8, n - 2)
+                ig = min(cg >> 8, n - 2)
+                ib = min(cb >> 8, n - 2)
+                fr = cr - (ir << 8)
+                fg = cg - (ig << 8)
+                fb = cb - (ib << 8)
+                base = (ir * n + ig) * n + ib
+                
+                for c in range(3):
+                    c00 = (lut[base, c] * (256 - fr) + lut[base + step_r, c] * fr + 128) >> 8
+                    c01 = (lut[base + 1, c] * (256 - fr) + lut[base + step_r + 1, c] * fr + 128) >> 8
+                    c10 = (lut[base + step_g, c] * (256 - fr) + lut[base + step_r + step_g, c] * fr + 128) >> 8
+                    c11 = (lut[base + step_g + 1, c] * (256 - fr) + lut[base + step_r + step_g + 1, c] * fr + 128) >> 8
+                    c0 = (c00 * (256 - fg) + c10 * fg + 128) >> 8
+                    c1 = (c01 * (256 - fg) + c11 * fg + 128) >> 8
+                    value = (c0 * (256 - fb) + c1 * fb + 128) >> 8
+                    out[y, x, c] = np.uint8(min((value + 128) >> 8, 255))
+else:
+    _interpolate_lut_numba = None
+
 class ImageProcessor:
     """Class untuk processing gambar: LUT, cropping, watermarking"""
     
     def __init__(self):
         """Inisialisasi image processor"""
         self.lut_cache = {}  # Cache untuk LUT yang sudah dimuat
+        self.lut_strip_cache = {}  # Cache LUT sebagai strip 2D (N, N*N, 3) untuk cv2.remap
+        self.lut_fixed_cache = {}  # Cache LUT uint16 Q8.8 flat (N^3, 3) untuk kernel Numba
+        self.baked_lut_cache = {}  # Cache LUT 256^3 uint8 siap pakai per (path, intensity)
         self.watermark_cache = {}  # Cache untuk watermark
+        self.watermark_prepared_cache = {}  # Cache watermark siap blend per (path, lebar, opacity)
+        self.crop_cache = {}  # Cache dimensi crop per (height, width, target_ratio)
+        # Buffer kerja per-thread (processor dipakai bersama oleh worker ThreadPoolExecutor)
+        self._scratch = threading.local()
+        self._bake_lock = threading.Lock()  # Satu bake per (path, intensity) meski dipanggil paralel
         logger.info("Image processor berhasil diinisialisasi")
     
+    def _get_scratch(self, name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """
+        Ambil buffer kerja milik thread ini, alokasi ulang hanya jika shape/dtype berubah
+        
+        Args:
+            name: Nama buffer
+            shape: Shape yang dibutuhkan
+            dtype: Tipe data yang dibutuhkan
+            
+        Returns:
+            Buffer (isi tidak diinisialisasi)
+        """
+        pool = getattr(self._scratch, "pool", None)
+        if pool is None:
+            pool = self._scratch.pool = {}
+        
+        buffer = pool.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            pool[name] = buffer
+        return buffer
+    
+    def _lut_path(self, lut_path: Optional[Path] = None) -> Path:
+        """Path LUT, default dari config"""
+        if lut_path is None:
+            return Config.PRESETS_DIR / Config.LUT_SETTINGS["file"]
+        return lut_path
+    
     def load_lut(self, lut_path: Optional[Path] = None) -> Optional[np.ndarray]:
         """
         Load LUT file (.cube format)
@@ -31,8 +123,7 @@ class ImageProcessor:
         Returns:
             LUT array atau None jika gagal
         """
-        if lut_path is None:
-            lut_path = Config.PRESETS_DIR / Config.LUT_SETTINGS["file"]
+        lut_path = self._lut_path(lut_path)
         
         # Check cache
         cache_key = str(lut_path)
@@ -40,52 +131,40 @@ class ImageProcessor:
             return self.lut_cache[cache_key]
         
         try:
-            if not lut_path.exists():
+            try:
+                cube_stat = lut_path.stat()
+            except FileNotFoundError:
                 logger.warning(f"File LUT tidak ditemukan: {lut_path}")
                 return None
             
-            # Load .cube LUT file
-            with open(lut_path, 'r') as f:
-                lines = f.readlines()
-            
-            # Parse .cube file
-            lut_size = 33  # Default size untuk .cube
-            lut_data = []
-            
-            for line in lines:
-                line = line.strip()
-                
-                # Skip comments dan metadata
-                if line.startswith('#') or line.startswith('TITLE') or line.startswith('DOMAIN_MIN') or line.startswith('DOMAIN_MAX'):
-                    continue
-                    
-                # Check LUT size
-                if line.startswith('LUT_3D_SIZE'):
-                    lut_size = int(line.split()[1])
-                    continue
-                
-                # Parse RGB values
-                if line and not line.startswith('LUT_1D_SIZE'):
-                    try:
-                        r, g, b = map(float, line.split()[:3])
-                        lut_data.append([r, g, b])
-                    except ValueError:
-                        continue
-            
-            if len(lut_data) != lut_size ** 3:
-                logger.error(f"LUT size mismatch: expected {lut_size**3}, got {len(lut_data)}")
-                return None
-            
-            # Convert ke numpy array dan reshape
-            lut_array = np.array(lut_data, dtype=np.float32)
-            lut_array = lut_array.reshape(lut_size, lut_size, lut_size, 3)
-            
-            # Convert dari range 0-1 ke 0-255 jika diperlukan
-            if lut_array.max() <= 1.0:
-                lut_array = lut_array * 255
-            
-            # Cache LUT
+            # LUT hasil parse disimpan sebagai .npy di sebelah .cube (np.load mmap, tanpa parse
+            # ulang puluhan ribu angka teks). mtime_ns dan size .cube ada di nama file, jadi
+            # .npy hanya dipakai jika persis cocok (.cube diganti file lama pun tetap terdeteksi)
+            npy_path = lut_path.with_name(
+                f"{lut_path.stem}.{cube_stat.st_mtime_ns}-{cube_stat.st_size}.npy"
+            )
+            lut_array = None
+            try:
+                lut_array = np.load(npy_path, mmap_mode='r')
+            except (OSError, ValueError):
+                pass  # Belum ada / rusak: parse .cube
+            
+            if lut_array is None or lut_array.ndim != 4 or lut_array.shape[3] != 3:
+                lut_array = self._parse_cube(lut_path)
+                if lut_array is None:
+                    return None
+                self._save_lut_npy(lut_path, npy_path, lut_array)
+            lut_size = lut_array.shape[0]
+            
+            # Cache LUT, plus strip 2D: slice sumbu pertama disusun berdampingan,
+            # strip[i1, i0 * N + i2] = lut[i0, i1, i2]
             self.lut_cache[cache_key] = lut_array
+            self.lut_strip_cache[cache_key] = np.ascontiguousarray(
+                lut_array.transpose(1, 0, 2, 3).reshape(lut_size, lut_size * lut_size, 3)
+            )
+            if _interpolate_lut_numba is not None:
+                lut_fixed = np.clip(np.rint(lut_array * 256.0), 0, 255 * 256).astype(np.uint16)
+                self.lut_fixed_cache[cache_key] = lut_fixed.reshape(-1, 3)
             
             logger.info(f"✅ LUT berhasil dimuat: {lut_path} (size: {lut_size}x{lut_size}x{lut_size})")
             return lut_array
@@ -94,7 +173,77 @@ class ImageProcessor:
             logger.error(f"Gagal memuat LUT {lut_path}: {e}")
             return None
     
-    def apply_lut(self, image: np.ndarray, lut_path: Optional[Path] = None, intensity: float = 1.0) -> np.ndarray:
+    def _parse_cube(self, lut_path: Path) -> Optional[np.ndarray]:
+        """
+        Parse file .cube ke array LUT
+        
+        Args:
+            lut_path: Path ke file .cube
+            
+        Returns:
+            Array float32 (N, N, N, 3) range 0-255 dengan index lut[r, g, b], atau None jika tidak valid
+        """
+        text = lut_path.read_text()
+        
+        # Check LUT size (default 33 untuk .cube)
+        size_match = LUT_3D_SIZE_PATTERN.search(text)
+        lut_size = int(size_match.group(1)) if size_match else 33
+        
+        # Buang komentar dan baris metadata (TITLE, DOMAIN_*, LUT_*), lalu parse
+        # semua nilai RGB sekaligus di C
+        body = CUBE_HEADER_PATTERN.sub('', text)
+        lut_array = np.fromstring(body, dtype=np.float32, sep=' ')
+        
+        if lut_array.size != lut_size ** 3 * 3:
+            logger.error(f"LUT size mismatch: expected {lut_size**3}, got {lut_array.size // 3}")
+            return None
+        
+        # Reshape ke (N, N, N, 3). Di file .cube R berubah paling cepat (urutan [B][G][R]),
+        # jadi axis di-reindex sekali di sini supaya lut[r, g, b] langsung benar
+        lut_array = np.ascontiguousarray(
+            lut_array.reshape(lut_size, lut_size, lut_size, 3).transpose(2, 1, 0, 3)
+        )
+        
+        # Convert dari range 0-1 ke 0-255 jika diperlukan
+        if lut_array.max() <= 1.0:
+            lut_array *= 255.0
+        
+        return lut_array
+    
+    @staticmethod
+    def _save_lut_npy(lut_path: Path, npy_path: Path, lut_array: np.ndarray):
+        """
+        Simpan LUT hasil parse ke .npy (atomic via rename, dilewati jika folder read-only),
+        lalu hapus .npy versi lama dari .cube yang sama
+        """
+        tmp_path = None
+        try:
+            # Nama temp unik per panggilan: load pertama paralel tidak saling menimpa temp
+            with tempfile.NamedTemporaryFile(dir=npy_path.parent, prefix=f"{npy_path.name}.",
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                np.save(f, lut_array)
+            os.replace(tmp_path, npy_path)
+        except OSError as e:
+            logger.debug(f"Cache LUT .npy tidak disimpan ({npy_path}): {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return
+        
+        stale = re.compile(rf'{re.escape(lut_path.stem)}(\.\d+-\d+)?\.npy')
+        with os.scandir(npy_path.parent) as entries:
+            for entry in entries:
+                if entry.name != npy_path.name and stale.fullmatch(entry.name):
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+    
+    def apply_lut(self, image: np.ndarray, lut_path: Optional[Path] = None, intensity: float = 1.0,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Aplikasikan LUT ke gambar
         
@@ -102,82 +251,144 @@ class ImageProcessor:
             image: Input image (BGR format)
             lut_path: Path ke LUT file (optional)
             intensity: Intensitas aplikasi LUT (0.0-1.0)
+            out: Buffer output (optional, shape dan dtype sama dengan image)
             
         Returns:
             Gambar dengan LUT applied
         """
         try:
+            # Intensity 0 = gambar asli, tidak perlu bake/gather maupun copy
+            if intensity <= 0.0:
+                return image
+            
             # Load LUT
             lut = self.load_lut(lut_path)
             if lut is None:
                 logger.warning("LUT tidak tersedia, skip aplikasi LUT")
                 return image
             
-            # Convert BGR ke RGB untuk processing
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            original_image = rgb_image.copy()
-            
-            # Normalisasi input ke range 0-1
-            normalized_img = rgb_image.astype(np.float32) / 255.0
-            
-            # Apply LUT menggunakan interpolasi trilinear
-            lut_size = lut.shape[0]
-            
-            # Scale coordinates ke LUT space
-            coords = normalized_img * (lut_size - 1)
-            
-            # Floor coordinates untuk interpolasi
-            coords_floor = np.floor(coords).astype(np.int32)
-            coords_floor = np.clip(coords_floor, 0, lut_size - 2)
-            
-            # Fractional parts untuk interpolasi
-            fractions = coords - coords_floor
-            
-            # Trilinear interpolation
-            # Get 8 corner values
-            c000 = lut[coords_floor[:,:,0], coords_floor[:,:,1], coords_floor[:,:,2]]
-            c001 = lut[coords_floor[:,:,0], coords_floor[:,:,1], coords_floor[:,:,2] + 1]
-            c010 = lut[coords_floor[:,:,0], coords_floor[:,:,1] + 1, coords_floor[:,:,2]]
-            c011 = lut[coords_floor[:,:,0], coords_floor[:,:,1] + 1, coords_floor[:,:,2] + 1]
-            c100 = lut[coords_floor[:,:,0] + 1, coords_floor[:,:,1], coords_floor[:,:,2]]
-            c101 = lut[coords_floor[:,:,0] + 1, coords_floor[:,:,1], coords_floor[:,:,2] + 1]
-            c110 = lut[coords_floor[:,:,0] + 1, coords_floor[:,:,1] + 1, coords_floor[:,:,2]]
-            c111 = lut[coords_floor[:,:,0] + 1, coords_floor[:,:,1] + 1, coords_floor[:,:,2] + 1]
-            
-            # Interpolate along x
-            xf = fractions[:,:,0:1]
-            c00 = c000 * (1 - xf) + c100 * xf
-            c01 = c001 * (1 - xf) + c101 * xf
-            c10 = c010 * (1 - xf) + c110 * xf
-            c11 = c011 * (1 - xf) + c111 * xf
-            
-            # Interpolate along y
-            yf = fractions[:,:,1:2]
-            c0 = c00 * (1 - yf) + c10 * yf
-            c1 = c01 * (1 - yf) + c11 * yf
-            
-            # Interpolate along z
-            zf = fractions[:,:,2:3]
-            result = c0 * (1 - zf) + c1 * zf
-            
-            # Convert kembali ke 0-255 range
-            result = np.clip(result, 0, 255).astype(np.uint8)
-            
-            # Blend dengan original berdasarkan intensity
-            if intensity < 1.0:
-                result = original_image * (1 - intensity) + result * intensity
-                result = result.astype(np.uint8)
-            
-            # Convert kembali ke BGR
-            result_bgr = cv2.cvtColor(result, cv2.COLOR_RGB2BGR)
-            
-            logger.info(f"✅ LUT applied dengan intensity {intensity}")
+            # LUT yang sudah di-bake untuk semua 2^24 warna (termasuk blend intensity)
+            baked = self._baked_lut(lut_path, intensity)
+            
+            # Index linear (R << 16 | G << 8 | B) langsung dari channel BGR, lalu satu gather
+            # per pixel. Tabel sudah berisi output BGR, jadi tanpa cvtColor sama sekali.
+            # Index dan temporary-nya memakai buffer kerja thread ini, tidak dialokasi per frame.
+            shape = image.shape[:2]
+            index = self._get_scratch("lut_index", shape, np.uint32)
+            shifted = self._get_scratch("lut_shift", shape, np.uint32)
+            np.left_shift(image[:, :, 2], 16, out=index, dtype=np.uint32)
+            np.left_shift(image[:, :, 1], 8, out=shifted, dtype=np.uint32)
+            index |= shifted
+            index |= image[:, :, 0]
+            # mode='clip': index pasti < 2^24, dan tanpa 'raise' NumPy menulis langsung ke out
+            # (mode default mem-buffer out ke temporary lalu copy)
+            result_bgr = np.take(baked, index, axis=0, out=out, mode='clip')
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ LUT applied dengan intensity %s", intensity)
             return result_bgr
             
         except Exception as e:
             logger.error(f"Error saat aplikasi LUT: {e}")
             return image
     
+    def _baked_lut(self, lut_path: Optional[Path], intensity: float) -> np.ndarray:
+        """
+        Bake LUT ke tabel uint8 untuk semua 2^24 warna RGB, di-cache per (path, intensity).
+        Biaya bake (16.7M interpolasi) kurang dari satu foto kamera 24MP, setelah itu
+        apply_lut hanya berupa satu gather per pixel.
+        
+        Args:
+            lut_path: Path ke LUT file (optional, LUT harus sudah dimuat via load_lut)
+            intensity: Intensitas aplikasi LUT (0.0-1.0)
+            
+        Returns:
+            Tabel (2^24, 3) uint8 output BGR, index = R << 16 | G << 8 | B
+        """
+        cache_key = (str(self._lut_path(lut_path)), float(intensity))
+        baked = self.baked_lut_cache.get(cache_key)
+        if baked is not None:
+            return baked
+        
+        # Thread lain yang miss bersamaan menunggu hasil bake ini (tabel 48 MB), bukan bake ulang
+        with self._bake_lock:
+            baked = self.baked_lut_cache.get(cache_key)
+            if baked is None:
+                baked = self._bake_lut(cache_key, intensity)
+                self.baked_lut_cache[cache_key] = baked
+        return baked
+    
+    def _bake_lut(self, cache_key: Tuple[str, float], intensity: float) -> np.ndarray:
+        """Isi tabel (2^24, 3) uint8 BGR untuk _baked_lut"""
+        baked = np.empty((256, 256, 256, 3), dtype=np.uint8)
+        
+        # Grid G x B untuk satu nilai R, diproses per blok R supaya memory tetap kecil
+        levels = np.arange(256, dtype=np.uint8)
+        green, blue = np.meshgrid(levels, levels, indexing='ij')
+        block = 16
+        grid = np.empty((block, 256, 256, 3), dtype=np.uint8)
+        grid[..., 1] = green
+        grid[..., 2] = blue
+        
+        for r_start in range(0, 256, block):
+            grid[..., 0] = levels[r_start:r_start + block, None, None]
+            rgb_block = grid.reshape(block * 256, 256, 3)
+            result = self._interpolate_lut(rgb_block, cache_key[0])
+            
+            # Blend dengan original berdasarkan intensity (uint8 saturasi, in-place, tanpa float64)
+            if intensity < 1.0:
+                cv2.addWeighted(result, intensity, rgb_block, 1.0 - intensity, 0.0, dst=result)
+            
+            # Simpan output dalam urutan BGR
+            baked[r_start:r_start + block] = result.reshape(block, 256, 256, 3)[..., ::-1]
+        
+        logger.info(f"LUT di-bake ke tabel 256^3 (intensity {intensity})")
+        return baked.reshape(-1, 3)
+    
+    def _interpolate_lut(self, rgb_image: np.ndarray, lut_key: str) -> np.ndarray:
+        """
+        Interpolasi trilinear LUT untuk setiap pixel
+        
+        Args:
+            rgb_image: Input image (RGB uint8)
+            lut_key: Cache key LUT yang sudah dimuat via load_lut
+            
+        Returns:
+            Hasil LUT (RGB uint8)
+        """
+        # Kernel Numba paralel fixed-point: satu pass per pixel tanpa array temporary
+        if _interpolate_lut_numba is not None:
+            result = np.empty_like(rgb_image)
+            lut_size = self.lut_cache[lut_key].shape[0]
+            _interpolate_lut_numba(rgb_image, self.lut_fixed_cache[lut_key], lut_size, result)
+            return result
+        
+        # Scale coordinates langsung dari 0-255 ke LUT space dalam satu pass
+        lut_strip = self.lut_strip_cache[lut_key]
+        lut_size = lut_strip.shape[0]
+        coords = rgb_image.astype(np.float32)
+        coords *= np.float32((lut_size - 1) / 255.0)
+        r, map_y, b = cv2.split(coords)
+        
+        # Trilinear = lerp sumbu pertama antara dua interpolasi bilinear (sumbu 2 dan 3)
+        # di strip 2D. cv2.remap mengerjakan bilinear untuk 3 channel sekaligus di C/SIMD.
+        r_floor = np.minimum(np.floor(r), lut_size - 2)
+        r_frac = r - r_floor
+        map_x = r_floor * lut_size + b
+        
+        result = cv2.remap(lut_strip, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        map_x += lut_size
+        upper = cv2.remap(lut_strip, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        
+        # result + (upper - result) * r_frac, in-place
+        upper -= result
+        upper *= r_frac[:, :, None]
+        result += upper
+        
+        # Convert kembali ke 0-255 uint8: saturate + cast dalam satu pass C/SIMD
+        # (nilai LUT tidak negatif, jadi abs tidak mengubah hasil)
+        return cv2.convertScaleAbs(result)
+    
     def detect_orientation(self, image: np.ndarray) -> str:
         """
         Deteksi orientasi gambar (portrait atau landscape)
@@ -203,6 +414,12 @@ class ImageProcessor:
             Tuple (x, y, width, height) untuk crop
         """
         height, width = image.shape[:2]
+        
+        # Batch foto dari kamera yang sama punya resolusi sama
+        cache_key = (height, width, tuple(target_ratio))
+        if cache_key in self.crop_cache:
+            return self.crop_cache[cache_key]
+        
         target_w, target_h = target_ratio
         
         # Hitung ratio
@@ -222,6 +439,7 @@ class ImageProcessor:
             x = 0
             y = (height - new_height) // 2
         
+        self.crop_cache[cache_key] = (x, y, new_width, new_height)
         return x, y, new_width, new_height
     
     def auto_crop(self, image: np.ndarray) -> np.ndarray:
@@ -251,16 +469,24 @@ class ImageProcessor:
             # Check minimum resolution
             min_res = Config.AUTO_CROP["min_resolution"]
             if cropped.shape[1] < min_res[0] or cropped.shape[0] < min_res[1]:
-                logger.warning(f"Hasil crop terlalu kecil ({cropped.shape[1]}x{cropped.shape[0]}), skip cropping")
+                logger.warning("Hasil crop terlalu kecil (%dx%d), skip cropping", cropped.shape[1], cropped.shape[0])
                 return image
             
-            logger.info(f"✅ Auto crop {orientation}: {image.shape[1]}x{image.shape[0]} -> {width}x{height}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ Auto crop %s: %dx%d -> %dx%d",
+                            orientation, image.shape[1], image.shape[0], width, height)
             return cropped
             
         except Exception as e:
             logger.error(f"Error saat auto crop: {e}")
             return image
     
+    def _watermark_path(self, watermark_path: Optional[Path] = None) -> Path:
+        """Path watermark, default dari config"""
+        if watermark_path is None:
+            return Config.WATERMARKS_DIR / Config.WATERMARK["file"]
+        return watermark_path
+    
     def load_watermark(self, watermark_path: Optional[Path] = None) -> Optional[np.ndarray]:
         """
         Load watermark image dengan transparency
@@ -269,10 +495,9 @@ class ImageProcessor:
             watermark_path: Path ke watermark (optional)
             
         Returns:
-            Watermark image dengan alpha channel atau None
+            Watermark image BGRA atau None
         """
-        if watermark_path is None:
-            watermark_path = Config.WATERMARKS_DIR / Config.WATERMARK["file"]
+        watermark_path = self._watermark_path(watermark_path)
         
         # Check cache
         cache_key = str(watermark_path)
@@ -284,9 +509,19 @@ class ImageProcessor:
                 logger.warning(f"File watermark tidak ditemukan: {watermark_path}")
                 return None
             
-            # Load dengan PIL untuk preserve alpha channel
-            watermark_pil = Image.open(watermark_path).convert("RGBA")
-            watermark_array = np.array(watermark_pil)
+            # Load langsung sebagai BGRA (urutan channel sama dengan gambar BGR)
+            watermark_array = cv2.imread(str(watermark_path), cv2.IMREAD_UNCHANGED)
+            if watermark_array is None:
+                logger.error(f"Gagal membaca watermark: {watermark_path}")
+                return None
+            
+            if watermark_array.dtype != np.uint8:  # PNG 16-bit
+                watermark_array = cv2.convertScaleAbs(watermark_array, alpha=255.0 / 65535.0)
+            
+            if watermark_array.ndim == 2:
+                watermark_array = cv2.cvtColor(watermark_array, cv2.COLOR_GRAY2BGRA)
+            elif watermark_array.shape[2] == 3:
+                watermark_array = cv2.cvtColor(watermark_array, cv2.COLOR_BGR2BGRA)
             
             # Cache watermark
             self.watermark_cache[cache_key] = watermark_array
@@ -298,6 +533,42 @@ class ImageProcessor:
             logger.error(f"Gagal memuat watermark {watermark_path}: {e}")
             return None
     
+    def _prepare_watermark(self, watermark_path: Optional[Path], watermark_width: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Resize watermark dan pisahkan alpha-nya, di-cache per (path, lebar, opacity)
+        sehingga batch gambar beresolusi sama hanya sekali resize Lanczos
+        
+        Args:
+            watermark_path: Path ke watermark (optional)
+            watermark_width: Lebar target watermark
+            
+        Returns:
+            Tuple (watermark BGR float32, alpha float32 (h, w, 1) sudah dikali opacity) atau None
+        """
+        opacity = Config.WATERMARK["opacity"]
+        cache_key = (str(self._watermark_path(watermark_path)), watermark_width, opacity)
+        if cache_key in self.watermark_prepared_cache:
+            return self.watermark_prepared_cache[cache_key]
+        
+        watermark = self.load_watermark(watermark_path)
+        if watermark is None:
+            return None
+        
+        # Resize watermark sambil maintain aspect ratio
+        wm_height, wm_width = watermark.shape[:2]
+        aspect_ratio = wm_height / wm_width
+        watermark_height = int(watermark_width * aspect_ratio)
+        
+        watermark_resized = cv2.resize(watermark, (watermark_width, watermark_height), interpolation=cv2.INTER_LANCZOS4)
+        
+        # Pisahkan BGR dan alpha watermark (alpha sudah dikali opacity), float32
+        watermark_bgr = watermark_resized[:, :, :3].astype(np.float32)
+        watermark_alpha = watermark_resized[:, :, 3:4].astype(np.float32) * (opacity / 255.0)
+        
+        prepared = (watermark_bgr, watermark_alpha)
+        self.watermark_prepared_cache[cache_key] = prepared
+        return prepared
+    
     def apply_watermark(self, image: np.ndarray, watermark_path: Optional[Path] = None) -> np.ndarray:
         """
         Aplikasikan watermark ke gambar
@@ -310,76 +581,69 @@ class ImageProcessor:
             Image dengan watermark
         """
         try:
-            # Load watermark
-            watermark = self.load_watermark(watermark_path)
-            if watermark is None:
-                logger.warning("Watermark tidak tersedia, skip watermark")
+            result_bgr = image.copy()
+            if not self._blend_watermark(result_bgr, watermark_path):
                 return image
-            
-            # Convert image ke RGBA untuk blending
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            image_rgba = np.dstack([image_rgb, np.ones((image_rgb.shape[0], image_rgb.shape[1]), dtype=np.uint8) * 255])
-            
-            # Hitung ukuran watermark
-            img_height, img_width = image.shape[:2]
-            size_ratio = Config.WATERMARK["size_ratio"]
-            watermark_width = int(img_width * size_ratio)
-            
-            # Resize watermark sambil maintain aspect ratio
-            wm_height, wm_width = watermark.shape[:2]
-            aspect_ratio = wm_height / wm_width
-            watermark_height = int(watermark_width * aspect_ratio)
-            
-            watermark_resized = cv2.resize(watermark, (watermark_width, watermark_height), interpolation=cv2.INTER_LANCZOS4)
-            
-            # Hitung posisi watermark
-            position = Config.WATERMARK["position"]
-            
-            if position["horizontal"] == "center":
-                x = (img_width - watermark_width) // 2
-            elif position["horizontal"] == "left":
-                x = 50  # Padding dari kiri
-            else:  # right
-                x = img_width - watermark_width - 50  # Padding dari kanan
-            
-            y = int(img_height * position["vertical"]) - watermark_height // 2
-            
-            # Pastikan watermark tidak keluar dari frame
-            x = max(0, min(x, img_width - watermark_width))
-            y = max(0, min(y, img_height - watermark_height))
-            
-            # Apply watermark dengan alpha blending
-            overlay = image_rgba.copy()
-            
-            # Extract alpha channel dari watermark
-            watermark_rgb = watermark_resized[:, :, :3]
-            watermark_alpha = watermark_resized[:, :, 3] / 255.0
-            
-            # Apply opacity setting
-            opacity = Config.WATERMARK["opacity"]
-            watermark_alpha = watermark_alpha * opacity
-            
-            # Alpha blending
-            for c in range(3):  # RGB channels
-                overlay[y:y+watermark_height, x:x+watermark_width, c] = (
-                    overlay[y:y+watermark_height, x:x+watermark_width, c] * (1 - watermark_alpha) +
-                    watermark_rgb[:, :, c] * watermark_alpha
-                )
-            
-            # Convert kembali ke BGR
-            result_rgb = overlay[:, :, :3]
-            result_bgr = cv2.cvtColor(result_rgb.astype(np.uint8), cv2.COLOR_RGB2BGR)
-            
-            logger.info(f"✅ Watermark applied di posisi ({x}, {y}) dengan ukuran {watermark_width}x{watermark_height}")
             return result_bgr
             
         except Exception as e:
             logger.error(f"Error saat aplikasi watermark: {e}")
             return image
     
+    def _blend_watermark(self, image: np.ndarray, watermark_path: Optional[Path] = None) -> bool:
+        """
+        Blend watermark langsung (in-place) ke gambar
+        
+        Args:
+            image: Image BGR yang akan dimodifikasi
+            watermark_path: Path ke watermark (optional)
+            
+        Returns:
+            True jika watermark diterapkan
+        """
+        # Hitung ukuran watermark
+        img_height, img_width = image.shape[:2]
+        watermark_width = int(img_width * Config.WATERMARK["size_ratio"])
+        
+        # Watermark yang sudah di-resize dan dipisah alpha-nya (cache per lebar gambar)
+        prepared = self._prepare_watermark(watermark_path, watermark_width)
+        if prepared is None:
+            logger.warning("Watermark tidak tersedia, skip watermark")
+            return False
+        
+        watermark_bgr, watermark_alpha = prepared
+        watermark_height = watermark_bgr.shape[0]
+        
+        # Hitung posisi watermark
+        position = Config.WATERMARK["position"]
+        
+        if position["horizontal"] == "center":
+            x = (img_width - watermark_width) // 2
+        elif position["horizontal"] == "left":
+            x = 50  # Padding dari kiri
+        else:  # right
+            x = img_width - watermark_width - 50  # Padding dari kanan
+        
+        y = int(img_height * position["vertical"]) - watermark_height // 2
+        
+        # Pastikan watermark tidak keluar dari frame
+        x = max(0, min(x, img_width - watermark_width))
+        y = max(0, min(y, img_height - watermark_height))
+        
+        # Alpha blending langsung di ROI gambar BGR, semua channel sekaligus
+        roi = image[y:y+watermark_height, x:x+watermark_width]
+        blended = roi * (1.0 - watermark_alpha) + watermark_bgr * watermark_alpha
+        roi[...] = blended.astype(np.uint8)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Watermark applied di posisi (%d, %d) dengan ukuran %dx%d",
+                        x, y, watermark_width, watermark_height)
+        return True
+    
     def process_full_pipeline(self, image: np.ndarray, output_path: Optional[Path] = None) -> Tuple[bool, Optional[Path]]:
         """
         Jalankan full pipeline: LUT -> Auto Crop -> Watermark
+        (dieksekusi sebagai crop view -> LUT -> watermark in-place, satu buffer output)
         
         Args:
             image: Input image
@@ -391,14 +655,23 @@ class ImageProcessor:
         try:
             logger.info("Memulai full processing pipeline...")
             
-            # Step 1: Apply LUT
-            processed = self.apply_lut(image, intensity=Config.LUT_SETTINGS["intensity"])
+            # Step 1: Auto Crop (view, tanpa copy). LUT bekerja per pixel, jadi crop lebih
+            # dulu memberi hasil yang sama dan LUT hanya diproses di area yang dipakai
+            cropped = self.auto_crop(image)
             
-            # Step 2: Auto Crop
-            processed = self.auto_crop(processed)
+            # Step 2: Apply LUT -> buffer output per-thread yang di-reuse antar frame
+            # (hasil hanya ditulis ke disk, tidak dikembalikan ke caller)
+            output = self._get_scratch("pipeline_output", cropped.shape, cropped.dtype)
+            processed = self.apply_lut(cropped, intensity=Config.LUT_SETTINGS["intensity"], out=output)
+            if processed is cropped:
+                np.copyto(output, cropped)  # LUT di-skip, jangan modifikasi gambar input
+                processed = output
             
-            # Step 3: Apply Watermark
-            processed = self.apply_watermark(processed)
+            # Step 3: Apply Watermark langsung di buffer output
+            try:
+                self._blend_watermark(processed)
+            except Exception as e:
+                logger.error(f"Error saat aplikasi watermark: {e}")
             
             # Save hasil
             if output_path is None:
@@ -407,10 +680,10 @@ class ImageProcessor:
             success = cv2.imwrite(str(output_path), processed, [cv2.IMWRITE_JPEG_QUALITY, 95])
             
             if success:
-                logger.info(f"✅ Full pipeline selesai: {output_path}")
+                logger.info("✅ Full pipeline selesai: %s", output_path)
                 return True, output_path
             else:
-                logger.error(f"Gagal menyimpan hasil: {output_path}")
+                logger.error("Gagal menyimpan hasil: %s", output_path)
                 return False, None
                 
         except Exception as e:
@@ -10,547 +10,745 @@ Interface interaktif untuk memilih semua konfigurasi sebelum mulai shooting.
 
 import sys
 import os
+import re
+import json
+import argparse
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import time
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
 
-# Import modules
-from config import Config
-from event_selector import EventSelector
+@dataclass
+class SetupConfig:
+    """Konfigurasi hasil interactive setup"""
+    event_id: Optional[str] = None
+    ai_mode: str = "auto"
+    ai_enabled: bool = True
+    ai_fallback: bool = True
+    ai_skip_on_failure: bool = False
+    face_protection: bool = True
+    lut_file: Optional[str] = "my_preset.cube"
+    lut_intensity: float = 1.0
+    watermark_file: Optional[str] = "my_logo.png"
+    watermark_enabled: bool = True
+    watermark_opacity: float = 0.8
+    crop_mode: str = "auto"
+    upload_quality: str = "high"
+    performance_mode: str = "balanced"
+    
+    def update(self, **values):
+        """Set beberapa field sekaligus (field yang tidak dikenal -> AttributeError)"""
+        unknown = values.keys() - _SETUP_FIELDS
+        if unknown:
+            raise AttributeError(f"Field konfigurasi tidak dikenal: {', '.join(sorted(unknown))}")
+        for field, value in values.items():
+            setattr(self, field, value)
+    
+    def derive_ai_fields(self, explicit=frozenset()):
+        """
+        Samakan ai_enabled/face_protection dengan ai_mode (seperti menu AI), kecuali yang diset eksplisit
+        
+        Args:
+            explicit: Nama field yang diberikan langsung oleh preset/cache
+        """
+        enabled = self.ai_mode != "disabled"
+        if "ai_enabled" not in explicit:
+            self.ai_enabled = enabled
+        if "face_protection" not in explicit and not enabled:
+            self.face_protection = False
+
+# Nama field SetupConfig (dataclass(slots=True) butuh Python 3.10, proyek masih 3.7+)
+_SETUP_FIELDS = frozenset(f.name for f in fields(SetupConfig))
+
+@dataclass(frozen=True)
+class MenuOption:
+    """Satu pilihan menu: label yang ditampilkan, pesan konfirmasi, dan perubahan config"""
+    key: str
+    label: str
+    message: str
+    apply: Callable[[SetupConfig], None]
+
+# Angka desimal non-negatif (mis. "1", "0.8", ".5") untuk intensity/opacity
+_FLOAT_RE = re.compile(r"^(\d+(\.\d*)?|\.\d+)$")
+
+# Template baris daftar bernomor ("  1. nama"), bound method dibuat sekali
+_OPT_TMPL = "  {}. {}".format
+
+# Jawaban yes/no yang dikenali
+_NO = frozenset({"n", "no", "tidak"})
+_YES = frozenset({"y", "yes", "ya"})
+
+# Label tampilan untuk review konfigurasi
+_AI_MODE_DISPLAY = {
+    "auto": "🔄 Auto (Gemini + OpenCV fallback)",
+    "gemini": "🤖 Gemini AI Only",
+    "opencv": "🎨 OpenCV Traditional Only",
+    "disabled": "🚫 Disabled"
+}
+
+_CROP_DISPLAY = {
+    "auto": "🔄 Auto (berdasarkan orientasi)",
+    "portrait": "📱 Force Portrait (5x7)",
+    "landscape": "🖥️ Force Landscape (7x5)",
+    "disabled": "🚫 Disabled"
+}
+
+_PERFORMANCE_DISPLAY = {
+    "speed": "🏃 Speed (prioritas kecepatan)",
+    "balanced": "⚖️ Balanced",
+    "quality": "🎯 Quality (prioritas kualitas)"
+}
+
+_QUALITY_DISPLAY = {
+    "high": "🔥 High (95%)",
+    "medium": "⚖️ Medium (80%)",
+    "low": "⚡ Low (70%)"
+}
+
+# Estimasi waktu (detik) per AI mode dan upload quality, plus faktor per performance mode
+_AI_COST = {"gemini": 15, "auto": 10, "opencv": 3, "disabled": 0}
+_UPLOAD_TIMES = {"high": 5, "medium": 3, "low": 2}
+_PERF_MULT = {"speed": 0.7, "balanced": 1.0, "quality": 1.3}
+
+# Schema selected_config: set = nilai yang diizinkan, tuple = (tipe, min, max), type = tipe wajib
+_SCHEMA = {
+    "ai_mode": frozenset(_AI_MODE_DISPLAY),
+    "crop_mode": frozenset(_CROP_DISPLAY),
+    "performance_mode": frozenset(_PERFORMANCE_DISPLAY),
+    "upload_quality": frozenset(_QUALITY_DISPLAY),
+    "lut_intensity": ((int, float), 0.0, 1.0),
+    "watermark_opacity": ((int, float), 0.0, 1.0),
+    "ai_enabled": bool,
+    "ai_fallback": bool,
+    "ai_skip_on_failure": bool,
+    "face_protection": bool,
+    "watermark_enabled": bool,
+}
+
+# Konfigurasi terakhir yang dikonfirmasi, ditawarkan ulang di awal setup
+_SETUP_CACHE_FILE = Path("~/.tethered_setup_cache.json").expanduser()
+
+@lru_cache(maxsize=8)
+def _list_dir(path: Path, pattern: str, dir_mtime: int) -> Tuple[Path, ...]:
+    """Glob direktori, di-cache per mtime (file baru/dihapus mengubah mtime direktori)"""
+    return tuple(path.glob(pattern))
+
+def _available_files(path: Path, pattern: str) -> Tuple[Path, ...]:
+    """Daftar file di direktori sesuai pattern, kosong jika direktori tidak ada"""
+    try:
+        dir_mtime = path.stat().st_mtime_ns
+    except OSError:
+        return ()
+    return _list_dir(path, pattern, dir_mtime)
 
 class InteractiveSetup:
     """Interactive setup untuk konfigurasi lengkap sistem"""
     
+    _SEP60 = "=" * 60
+    _SEP60_NL = "\n" + _SEP60
+    _SEP40 = "-" * 40
+    
+    # Tabel menu, dibangun sekali saat class didefinisikan
+    _AI_OPTIONS = (
+        MenuOption("auto", "🔄 Auto (Gemini AI + OpenCV fallback) - Recommended",
+                   "✅ Mode: Auto (Gemini + OpenCV fallback)",
+                   lambda c: c.update(ai_mode="auto", ai_enabled=True, ai_fallback=True)),
+        MenuOption("gemini", "🤖 Gemini Only (AI saja, kualitas terbaik)",
+                   "✅ Mode: Gemini AI Only",
+                   lambda c: c.update(ai_mode="gemini", ai_enabled=True, ai_fallback=False)),
+        MenuOption("opencv", "🎨 OpenCV Only (Traditional, cepat & reliable)",
+                   "✅ Mode: OpenCV Traditional Only",
+                   lambda c: c.update(ai_mode="opencv", ai_enabled=True, ai_fallback=False)),
+        MenuOption("disabled", "🚫 Disabled (Tidak ada enhancement, tercepat)",
+                   "✅ Mode: Enhancement Disabled",
+                   lambda c: c.update(ai_mode="disabled", ai_enabled=False, face_protection=False)),
+    )
+    
+    _CROP_OPTIONS = (
+        MenuOption("auto", "🔄 Auto (5x7 portrait, 7x5 landscape)",
+                   "✅ Crop: Auto (berdasarkan orientasi)",
+                   lambda c: c.update(crop_mode="auto")),
+        MenuOption("portrait", "📱 Force Portrait (5x7)",
+                   "✅ Crop: Force Portrait (5x7)",
+                   lambda c: c.update(crop_mode="portrait")),
+        MenuOption("landscape", "🖥️ Force Landscape (7x5)",
+                   "✅ Crop: Force Landscape (7x5)",
+                   lambda c: c.update(crop_mode="landscape")),
+        MenuOption("disabled", "🚫 No cropping",
+                   "✅ Crop: Disabled",
+                   lambda c: c.update(crop_mode="disabled")),
+    )
+    
+    _PERF_OPTIONS = (
+        MenuOption("speed", "🏃 Speed (prioritas kecepatan, minimal processing)",
+                   "✅ Performance: Speed Mode",
+                   lambda c: c.update(performance_mode="speed")),
+        MenuOption("balanced", "⚖️ Balanced (balance speed vs quality)",
+                   "✅ Performance: Balanced Mode",
+                   lambda c: c.update(performance_mode="balanced")),
+        MenuOption("quality", "🎯 Quality (prioritas kualitas, processing maksimal)",
+                   "✅ Performance: Quality Mode",
+                   lambda c: c.update(performance_mode="quality")),
+    )
+    
+    _UPLOAD_OPTIONS = (
+        MenuOption("high", "🔥 High (95% quality, file besar)",
+                   "✅ Upload Quality: High (95%)",
+                   lambda c: c.update(upload_quality="high")),
+        MenuOption("medium", "⚖️ Medium (80% quality, balanced)",
+                   "✅ Upload Quality: Medium (80%)",
+                   lambda c: c.update(upload_quality="medium")),
+        MenuOption("low", "⚡ Low (70% quality, file kecil, cepat upload)",
+                   "✅ Upload Quality: Low (70%)",
+                   lambda c: c.update(upload_quality="low")),
+    )
+    
     def __init__(self):
-        self.selected_config = {
-            "event_id": None,
-            "ai_mode": "auto",
-            "ai_enabled": True,
-            "ai_fallback": True,
-            "ai_skip_on_failure": False,
-            "face_protection": True,
-            "lut_file": "my_preset.cube",
-            "lut_intensity": 1.0,
-            "watermark_file": "my_logo.png",
-            "watermark_enabled": True,
-            "watermark_opacity": 0.8,
-            "crop_mode": "auto",
-            "upload_quality": "high",
-            "performance_mode": "balanced"
-        }
+        self._buf = []  # Output yang belum ditulis, di-flush sekali sebelum input / akhir step
+        self.selected_config = SetupConfig()
+        
+        # Konfigurasi terakhir yang dikonfirmasi (jika ada)
+        try:
+            self._last = json.loads(_SETUP_CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._last = None
         
-        print("🎛️  INTERACTIVE SETUP - SISTEM TETHERED SHOOTING")
-        print("=" * 60)
-        print("Konfigurasikan sistem sesuai kebutuhan event Anda")
-        print("=" * 60)
+        self._p("🎛️  INTERACTIVE SETUP - SISTEM TETHERED SHOOTING")
+        self._p(self._SEP60)
+        self._p("Konfigurasikan sistem sesuai kebutuhan event Anda")
+        self._p(self._SEP60)
+        self._flush()
+    
+    def _p(self, line: str = ""):
+        """Tambahkan satu baris ke buffer output"""
+        self._buf.append(line)
+    
+    def _flush(self):
+        """Tulis semua baris di buffer dengan satu write"""
+        if self._buf:
+            sys.stdout.write("\n".join(self._buf) + "\n")
+            sys.stdout.flush()
+            self._buf.clear()
+    
+    def _choose(self, title: str, prompt: str, options: Tuple[MenuOption, ...]) -> MenuOption:
+        """
+        Tampilkan menu bernomor dan minta input sampai pilihan valid
+        
+        Args:
+            title: Judul menu
+            prompt: Prompt input
+            options: Daftar pilihan
+            
+        Returns:
+            Pilihan yang sudah diaplikasikan ke selected_config
+        """
+        self._p(title)
+        for i, option in enumerate(options, 1):
+            self._p(f"{i}. {option.label}")
+        
+        while True:
+            self._flush()
+            choice = input(prompt).strip()
+            if choice.isdecimal() and 1 <= int(choice) <= len(options):
+                option = options[int(choice) - 1]
+                option.apply(self.selected_config)
+                self._p(option.message)
+                return option
+            self._p(f"⚠️ Pilihan tidak valid, masukkan 1-{len(options)}")
     
     def run_interactive_setup(self) -> Dict[str, Any]:
         """Jalankan full interactive setup"""
         try:
-            print("\n🚀 Memulai interactive setup...")
-            print("Tekan Ctrl+C kapan saja untuk keluar")
-            
-            # Step 1: Event Selection
-            if not self._select_event():
-                return None
-            
-            # Step 2: AI Enhancement Setup
-            if not self._setup_ai_enhancement():
-                return None
-            
-            # Step 3: Image Processing Setup
-            if not self._setup_image_processing():
-                return None
-            
-            # Step 4: Performance & Upload Setup
-            if not self._setup_performance_upload():
-                return None
+            self._p("\n🚀 Memulai interactive setup...")
+            self._p("Tekan Ctrl+C kapan saja untuk keluar")
+            
+            # Konfigurasi terakhir dipakai ulang -> langsung ke review (Step 5)
+            if not self._reuse_last_config():
+                # Step 1: Event Selection
+                if not self._select_event():
+                    return None
+                
+                # Step 2: AI Enhancement Setup
+                if not self._setup_ai_enhancement():
+                    return None
+                
+                # Step 3: Image Processing Setup
+                if not self._setup_image_processing():
+                    return None
+                
+                # Step 4: Performance & Upload Setup
+                if not self._setup_performance_upload():
+                    return None
             
             # Step 5: Final Review & Confirmation
             if not self._final_confirmation():
                 return None
             
-            return self.selected_config
+            return asdict(self.selected_config)
             
         except KeyboardInterrupt:
-            print("\n👋 Setup dibatalkan oleh user")
+            self._p("\n👋 Setup dibatalkan oleh user")
             return None
         except Exception as e:
-            print(f"\n❌ Error dalam interactive setup: {e}")
+            self._p(f"\n❌ Error dalam interactive setup: {e}")
             return None
+        finally:
+            self._flush()
+    
+    def _reuse_last_config(self) -> bool:
+        """Tawarkan konfigurasi terakhir; True jika dipakai (dan valid)"""
+        if not isinstance(self._last, dict):
+            return False
+        
+        self._flush()
+        answer = input("♻️ Gunakan konfigurasi terakhir? (Y/n): ").strip().lower()
+        if answer and answer not in _YES:
+            return False
+        
+        try:
+            self.selected_config.update(**self._last)
+            self.selected_config.derive_ai_fields(self._last.keys())
+            self._validate()
+            return True
+        except (AttributeError, TypeError, ValueError) as e:
+            self._p(f"⚠️ Konfigurasi terakhir tidak valid ({e}), setup dari awal")
+            self.selected_config = SetupConfig()
+            return False
+    
+    def _save_last_config(self):
+        """Simpan konfigurasi yang dikonfirmasi untuk run berikutnya"""
+        try:
+            _SETUP_CACHE_FILE.write_text(json.dumps(asdict(self.selected_config), indent=2), encoding="utf-8")
+        except OSError as e:
+            self._p(f"⚠️ Gagal menyimpan konfigurasi terakhir: {e}")
     
     def _select_event(self) -> bool:
         """Step 1: Event Selection"""
         try:
-            print(f"\n{'='*60}")
-            print("📅 STEP 1: PILIH EVENT")
-            print(f"{'='*60}")
+            self._p(self._SEP60_NL)
+            self._p("📅 STEP 1: PILIH EVENT")
+            self._p(self._SEP60)
+            
+            from event_selector import EventSelector  # Lazy import, hanya saat step ini jalan
             
+            self._flush()  # EventSelector menulis ke stdout sendiri
             event_selector = EventSelector()
             selected_event_id = event_selector.select_event_interactive()
             
             if not selected_event_id:
-                print("❌ Event selection dibatalkan")
+                self._p("❌ Event selection dibatalkan")
                 return False
             
-            self.selected_config["event_id"] = selected_event_id
-            print(f"✅ Event terpilih: {selected_event_id}")
+            self.selected_config.event_id = selected_event_id
+            self._p(f"✅ Event terpilih: {selected_event_id}")
             
             return True
             
         except Exception as e:
-            print(f"❌ Error dalam event selection: {e}")
+            self._p(f"❌ Error dalam event selection: {e}")
             return False
     
     def _setup_ai_enhancement(self) -> bool:
         """Step 2: AI Enhancement Setup"""
         try:
-            print(f"\n{'='*60}")
-            print("🤖 STEP 2: AI ENHANCEMENT SETUP")
-            print(f"{'='*60}")
-            
-            print("Pilih mode AI enhancement untuk foto:")
-            print("1. 🔄 Auto (Gemini AI + OpenCV fallback) - Recommended")
-            print("2. 🤖 Gemini Only (AI saja, kualitas terbaik)")
-            print("3. 🎨 OpenCV Only (Traditional, cepat & reliable)")
-            print("4. 🚫 Disabled (Tidak ada enhancement, tercepat)")
-            
-            while True:
-                choice = input("\n❓ Pilihan Anda (1-4): ").strip()
-                
-                if choice == "1":
-                    self.selected_config["ai_mode"] = "auto"
-                    self.selected_config["ai_enabled"] = True
-                    self.selected_config["ai_fallback"] = True
-                    print("✅ Mode: Auto (Gemini + OpenCV fallback)")
-                    break
-                elif choice == "2":
-                    self.selected_config["ai_mode"] = "gemini"
-                    self.selected_config["ai_enabled"] = True
-                    self.selected_config["ai_fallback"] = False
-                    print("✅ Mode: Gemini AI Only")
-                    break
-                elif choice == "3":
-                    self.selected_config["ai_mode"] = "opencv"
-                    self.selected_config["ai_enabled"] = True
-                    self.selected_config["ai_fallback"] = False
-                    print("✅ Mode: OpenCV Traditional Only")
-                    break
-                elif choice == "4":
-                    self.selected_config["ai_mode"] = "disabled"
-                    self.selected_config["ai_enabled"] = False
-                    self.selected_config["face_protection"] = False
-                    print("✅ Mode: Enhancement Disabled")
-                    break
-                else:
-                    print("⚠️ Pilihan tidak valid, masukkan 1-4")
-            
-            # Advanced AI options (jika AI enabled)
-            if self.selected_config["ai_enabled"]:
-                print(f"\n🔧 Advanced AI Options:")
-                
-                # Face protection
-                if self.selected_config["ai_mode"] != "disabled":
-                    face_protection = input("🛡️ Enable face protection? (Y/n): ").strip().lower()
-                    self.selected_config["face_protection"] = face_protection not in ['n', 'no', 'tidak']
-                
-                # Skip on failure
-                if self.selected_config["ai_mode"] in ["gemini", "auto"]:
-                    skip_failure = input("⏭️ Skip jika AI gagal? (y/N): ").strip().lower()
-                    self.selected_config["ai_skip_on_failure"] = skip_failure in ['y', 'yes', 'ya']
-                
-                print(f"   Face Protection: {self.selected_config['face_protection']}")
-                print(f"   Skip on Failure: {self.selected_config['ai_skip_on_failure']}")
+            self._p(self._SEP60_NL)
+            self._p("🤖 STEP 2: AI ENHANCEMENT SETUP")
+            self._p(self._SEP60)
+            
+            option = self._choose("Pilih mode AI enhancement untuk foto:",
+                                  "\n❓ Pilihan Anda (1-4): ", self._AI_OPTIONS)
+            
+            # Disabled: tidak ada advanced options
+            if option.key == "disabled":
+                return True
+            
+            # Advanced AI options
+            self._p(f"\n🔧 Advanced AI Options:")
+            
+            # Face protection
+            self._flush()
+            face_protection = input("🛡️ Enable face protection? (Y/n): ").strip().lower()
+            self.selected_config.face_protection = face_protection not in _NO
+            
+            # Skip on failure
+            if option.key in ("gemini", "auto"):
+                self._flush()
+                skip_failure = input("⏭️ Skip jika AI gagal? (y/N): ").strip().lower()
+                self.selected_config.ai_skip_on_failure = skip_failure in _YES
+            
+            self._p(f"   Face Protection: {self.selected_config.face_protection}")
+            self._p(f"   Skip on Failure: {self.selected_config.ai_skip_on_failure}")
             
             return True
             
         except Exception as e:
-            print(f"❌ Error dalam AI setup: {e}")
+            self._p(f"❌ Error dalam AI setup: {e}")
             return False
     
     def _setup_image_processing(self) -> bool:
         """Step 3: Image Processing Setup"""
+        from config import Config
+        
         try:
-            print(f"\n{'='*60}")
-            print("🎨 STEP 3: IMAGE PROCESSING SETUP")
-            print(f"{'='*60}")
+            self._p(self._SEP60_NL)
+            self._p("🎨 STEP 3: IMAGE PROCESSING SETUP")
+            self._p(self._SEP60)
             
             # LUT Selection
-            print("\n📁 LUT (Color Grading) Setup:")
-            available_luts = list(Config.PRESETS_DIR.glob("*.cube"))
+            self._p("\n📁 LUT (Color Grading) Setup:")
+            available_luts = _available_files(Config.PRESETS_DIR, "*.cube")
+            lut_names = tuple(lut_file.name for lut_file in available_luts)
             
             if available_luts:
-                print("Available LUT files:")
-                for i, lut_file in enumerate(available_luts, 1):
-                    print(f"  {i}. {lut_file.name}")
-                print(f"  {len(available_luts) + 1}. Skip LUT (no color grading)")
+                self._p("Available LUT files:")
+                for i, lut_name in enumerate(lut_names, 1):
+                    self._p(_OPT_TMPL(i, lut_name))
+                self._p(f"  {len(available_luts) + 1}. Skip LUT (no color grading)")
                 
                 while True:
+                    self._flush()
                     choice = input(f"\n❓ Pilih LUT (1-{len(available_luts) + 1}): ").strip()
                     try:
                         choice_int = int(choice)
                         if 1 <= choice_int <= len(available_luts):
-                            self.selected_config["lut_file"] = available_luts[choice_int - 1].name
-                            print(f"✅ LUT: {self.selected_config['lut_file']}")
+                            self.selected_config.lut_file = lut_names[choice_int - 1]
+                            self._p(f"✅ LUT: {self.selected_config.lut_file}")
                             
                             # LUT intensity
+                            self._flush()
                             intensity = input("🎯 LUT intensity (0.0-1.0, default 1.0): ").strip()
-                            try:
-                                self.selected_config["lut_intensity"] = float(intensity) if intensity else 1.0
-                                print(f"   Intensity: {self.selected_config['lut_intensity']}")
-                            except:
-                                self.selected_config["lut_intensity"] = 1.0
-                                print("   Intensity: 1.0 (default)")
+                            if _FLOAT_RE.match(intensity):
+                                self.selected_config.lut_intensity = min(1.0, max(0.0, float(intensity)))
+                                self._p(f"   Intensity: {self.selected_config.lut_intensity}")
+                            else:
+                                self.selected_config.lut_intensity = 1.0
+                                self._p("   Intensity: 1.0 (default)")
                             break
                         elif choice_int == len(available_luts) + 1:
-                            self.selected_config["lut_file"] = None
-                            print("✅ LUT: Disabled")
+                            self.selected_config.lut_file = None
+                            self._p("✅ LUT: Disabled")
                             break
                         else:
-                            print("⚠️ Pilihan tidak valid")
+                            self._p("⚠️ Pilihan tidak valid")
                     except ValueError:
-                        print("⚠️ Masukkan angka yang valid")
+                        self._p("⚠️ Masukkan angka yang valid")
             else:
-                print("⚠️ Tidak ada LUT file ditemukan, LUT disabled")
-                self.selected_config["lut_file"] = None
+                self._p("⚠️ Tidak ada LUT file ditemukan, LUT disabled")
+                self.selected_config.lut_file = None
             
             # Watermark Selection
-            print("\n💧 Watermark Setup:")
-            available_watermarks = list(Config.WATERMARKS_DIR.glob("*.png"))
+            self._p("\n💧 Watermark Setup:")
+            available_watermarks = _available_files(Config.WATERMARKS_DIR, "*.png")
+            wm_names = tuple(wm_file.name for wm_file in available_watermarks)
             
             if available_watermarks:
-                print("Available watermark files:")
-                for i, wm_file in enumerate(available_watermarks, 1):
-                    print(f"  {i}. {wm_file.name}")
-                print(f"  {len(available_watermarks) + 1}. No watermark")
+                self._p("Available watermark files:")
+                for i, wm_name in enumerate(wm_names, 1):
+                    self._p(_OPT_TMPL(i, wm_name))
+                self._p(f"  {len(available_watermarks) + 1}. No watermark")
                 
                 while True:
+                    self._flush()
                     choice = input(f"\n❓ Pilih watermark (1-{len(available_watermarks) + 1}): ").strip()
                     try:
                         choice_int = int(choice)
                         if 1 <= choice_int <= len(available_watermarks):
-                            self.selected_config["watermark_file"] = available_watermarks[choice_int - 1].name
-                            self.selected_config["watermark_enabled"] = True
-                            print(f"✅ Watermark: {self.selected_config['watermark_file']}")
+                            self.selected_config.watermark_file = wm_names[choice_int - 1]
+                            self.selected_config.watermark_enabled = True
+                            self._p(f"✅ Watermark: {self.selected_config.watermark_file}")
                             
                             # Watermark opacity
+                            self._flush()
                             opacity = input("👻 Watermark opacity (0.0-1.0, default 0.8): ").strip()
-                            try:
-                                self.selected_config["watermark_opacity"] = float(opacity) if opacity else 0.8
-                                print(f"   Opacity: {self.selected_config['watermark_opacity']}")
-                            except:
-                                self.selected_config["watermark_opacity"] = 0.8
-                                print("   Opacity: 0.8 (default)")
+                            if _FLOAT_RE.match(opacity):
+                                self.selected_config.watermark_opacity = min(1.0, max(0.0, float(opacity)))
+                                self._p(f"   Opacity: {self.selected_config.watermark_opacity}")
+                            else:
+                                self.selected_config.watermark_opacity = 0.8
+                                self._p("   Opacity: 0.8 (default)")
                             break
                         elif choice_int == len(available_watermarks) + 1:
-                            self.selected_config["watermark_enabled"] = False
-                            print("✅ Watermark: Disabled")
+                            self.selected_config.watermark_enabled = False
+                            self._p("✅ Watermark: Disabled")
                             break
                         else:
-                            print("⚠️ Pilihan tidak valid")
+                            self._p("⚠️ Pilihan tidak valid")
                     except ValueError:
-                        print("⚠️ Masukkan angka yang valid")
+                        self._p("⚠️ Masukkan angka yang valid")
             else:
-                print("⚠️ Tidak ada watermark file ditemukan, watermark disabled")
-                self.selected_config["watermark_enabled"] = False
+                self._p("⚠️ Tidak ada watermark file ditemukan, watermark disabled")
+                self.selected_config.watermark_enabled = False
             
             # Auto Crop Setup
-            print("\n✂️ Auto Crop Setup:")
-            print("1. 🔄 Auto (5x7 portrait, 7x5 landscape)")
-            print("2. 📱 Force Portrait (5x7)")
-            print("3. 🖥️ Force Landscape (7x5)")
-            print("4. 🚫 No cropping")
-            
-            while True:
-                choice = input("\n❓ Pilihan crop (1-4): ").strip()
-                if choice == "1":
-                    self.selected_config["crop_mode"] = "auto"
-                    print("✅ Crop: Auto (berdasarkan orientasi)")
-                    break
-                elif choice == "2":
-                    self.selected_config["crop_mode"] = "portrait"
-                    print("✅ Crop: Force Portrait (5x7)")
-                    break
-                elif choice == "3":
-                    self.selected_config["crop_mode"] = "landscape"
-                    print("✅ Crop: Force Landscape (7x5)")
-                    break
-                elif choice == "4":
-                    self.selected_config["crop_mode"] = "disabled"
-                    print("✅ Crop: Disabled")
-                    break
-                else:
-                    print("⚠️ Pilihan tidak valid, masukkan 1-4")
+            self._choose("\n✂️ Auto Crop Setup:", "\n❓ Pilihan crop (1-4): ", self._CROP_OPTIONS)
             
             return True
             
         except Exception as e:
-            print(f"❌ Error dalam image processing setup: {e}")
+            self._p(f"❌ Error dalam image processing setup: {e}")
             return False
     
     def _setup_performance_upload(self) -> bool:
         """Step 4: Performance & Upload Setup"""
         try:
-            print(f"\n{'='*60}")
-            print("⚡ STEP 4: PERFORMANCE & UPLOAD SETUP")
-            print(f"{'='*60}")
+            self._p(self._SEP60_NL)
+            self._p("⚡ STEP 4: PERFORMANCE & UPLOAD SETUP")
+            self._p(self._SEP60)
             
             # Performance Mode
-            print("\n🚀 Performance Mode (untuk Intel i5-3570, 8GB RAM):")
-            print("1. 🏃 Speed (prioritas kecepatan, minimal processing)")
-            print("2. ⚖️ Balanced (balance speed vs quality)")
-            print("3. 🎯 Quality (prioritas kualitas, processing maksimal)")
-            
-            while True:
-                choice = input("\n❓ Pilih performance mode (1-3): ").strip()
-                if choice == "1":
-                    self.selected_config["performance_mode"] = "speed"
-                    print("✅ Performance: Speed Mode")
-                    # Adjust settings for speed
-                    self._apply_speed_optimizations()
-                    break
-                elif choice == "2":
-                    self.selected_config["performance_mode"] = "balanced"
-                    print("✅ Performance: Balanced Mode")
-                    break
-                elif choice == "3":
-                    self.selected_config["performance_mode"] = "quality"
-                    print("✅ Performance: Quality Mode")
-                    # Adjust settings for quality
-                    self._apply_quality_optimizations()
-                    break
-                else:
-                    print("⚠️ Pilihan tidak valid, masukkan 1-3")
+            option = self._choose("\n🚀 Performance Mode (untuk Intel i5-3570, 8GB RAM):",
+                                  "\n❓ Pilih performance mode (1-3): ", self._PERF_OPTIONS)
+            if option.key == "speed":
+                self._apply_speed_optimizations()  # Adjust settings for speed
+            elif option.key == "quality":
+                self._apply_quality_optimizations()  # Adjust settings for quality
             
             # Upload Quality
-            print("\n📤 Upload Quality ke Web Project:")
-            print("1. 🔥 High (95% quality, file besar)")
-            print("2. ⚖️ Medium (80% quality, balanced)")
-            print("3. ⚡ Low (70% quality, file kecil, cepat upload)")
-            
-            while True:
-                choice = input("\n❓ Pilih upload quality (1-3): ").strip()
-                if choice == "1":
-                    self.selected_config["upload_quality"] = "high"
-                    print("✅ Upload Quality: High (95%)")
-                    break
-                elif choice == "2":
-                    self.selected_config["upload_quality"] = "medium"
-                    print("✅ Upload Quality: Medium (80%)")
-                    break
-                elif choice == "3":
-                    self.selected_config["upload_quality"] = "low"
-                    print("✅ Upload Quality: Low (70%)")
-                    break
-                else:
-                    print("⚠️ Pilihan tidak valid, masukkan 1-3")
+            self._choose("\n📤 Upload Quality ke Web Project:",
+                         "\n❓ Pilih upload quality (1-3): ", self._UPLOAD_OPTIONS)
             
             return True
             
         except Exception as e:
-            print(f"❌ Error dalam performance & upload setup: {e}")
+            self._p(f"❌ Error dalam performance & upload setup: {e}")
             return False
     
     def _apply_speed_optimizations(self):
         """Apply optimizations for speed mode"""
-        if self.selected_config["ai_mode"] == "auto":
-            self.selected_config["ai_mode"] = "opencv"
-            print("   🎨 AI mode changed to OpenCV for speed")
+        if self.selected_config.ai_mode == "auto":
+            self.selected_config.ai_mode = "opencv"
+            self._p("   🎨 AI mode changed to OpenCV for speed")
         
-        self.selected_config["ai_skip_on_failure"] = True
-        print("   ⏭️ Skip on failure enabled for speed")
+        if not self.selected_config.ai_skip_on_failure:
+            self.selected_config.ai_skip_on_failure = True
+            self._p("   ⏭️ Skip on failure enabled for speed")
     
     def _apply_quality_optimizations(self):
         """Apply optimizations for quality mode"""
-        if self.selected_config["ai_mode"] == "opencv":
-            self.selected_config["ai_mode"] = "auto"
-            print("   🤖 AI mode changed to Auto for quality")
+        if self.selected_config.ai_mode == "opencv":
+            self.selected_config.ai_mode = "auto"
+            self._p("   🤖 AI mode changed to Auto for quality")
         
-        self.selected_config["ai_fallback"] = True
-        print("   🔄 AI fallback enabled for quality")
+        if not self.selected_config.ai_fallback:
+            self.selected_config.ai_fallback = True
+            self._p("   🔄 AI fallback enabled for quality")
     
     def _final_confirmation(self) -> bool:
         """Step 5: Final Review & Confirmation"""
         try:
-            print(f"\n{'='*60}")
-            print("📋 STEP 5: FINAL CONFIGURATION REVIEW")
-            print(f"{'='*60}")
-            
-            print("\n🎯 KONFIGURASI YANG DIPILIH:")
-            print("-" * 40)
-            
-            # Event Info
-            print(f"📅 Event ID: {self.selected_config['event_id']}")
-            
-            # AI Enhancement
-            ai_mode_display = {
-                "auto": "🔄 Auto (Gemini + OpenCV fallback)",
-                "gemini": "🤖 Gemini AI Only",
-                "opencv": "🎨 OpenCV Traditional Only",
-                "disabled": "🚫 Disabled"
-            }
-            print(f"🤖 AI Enhancement: {ai_mode_display[self.selected_config['ai_mode']]}")
-            
-            if self.selected_config["ai_enabled"]:
-                print(f"   🛡️ Face Protection: {'Enabled' if self.selected_config['face_protection'] else 'Disabled'}")
-                if self.selected_config["ai_fallback"]:
-                    print(f"   🔄 OpenCV Fallback: Enabled")
-                if self.selected_config["ai_skip_on_failure"]:
-                    print(f"   ⏭️ Skip on Failure: Enabled")
-            
-            # Image Processing
-            if self.selected_config["lut_file"]:
-                print(f"🎨 LUT: {self.selected_config['lut_file']} (intensity: {self.selected_config['lut_intensity']})")
-            else:
-                print(f"🎨 LUT: Disabled")
-            
-            crop_display = {
-                "auto": "🔄 Auto (berdasarkan orientasi)",
-                "portrait": "📱 Force Portrait (5x7)",
-                "landscape": "🖥️ Force Landscape (7x5)",
-                "disabled": "🚫 Disabled"
-            }
-            print(f"✂️ Auto Crop: {crop_display[self.selected_config['crop_mode']]}")
-            
-            if self.selected_config["watermark_enabled"]:
-                print(f"💧 Watermark: {self.selected_config['watermark_file']} (opacity: {self.selected_config['watermark_opacity']})")
-            else:
-                print(f"💧 Watermark: Disabled")
-            
-            # Performance & Upload
-            performance_display = {
-                "speed": "🏃 Speed (prioritas kecepatan)",
-                "balanced": "⚖️ Balanced",
-                "quality": "🎯 Quality (prioritas kualitas)"
-            }
-            print(f"⚡ Performance: {performance_display[self.selected_config['performance_mode']]}")
-            
-            quality_display = {
-                "high": "🔥 High (95%)",
-                "medium": "⚖️ Medium (80%)",
-                "low": "⚡ Low (70%)"
-            }
-            print(f"📤 Upload Quality: {quality_display[self.selected_config['upload_quality']]}")
-            
-            # Workflow Preview
-            print(f"\n🔄 WORKFLOW YANG AKAN DIJALANKAN:")
-            print("-" * 40)
-            workflow_steps = []
-            workflow_steps.append("📸 Camera Capture")
-            workflow_steps.append("💾 Backup (RAW + JPG)")
+            self._p(self._SEP60_NL)
+            self._p("📋 STEP 5: FINAL CONFIGURATION REVIEW")
+            self._p(self._SEP60)
             
-            if self.selected_config["face_protection"]:
-                workflow_steps.append("👤 Face Detection")
-            
-            if self.selected_config["ai_enabled"]:
-                workflow_steps.append(f"🤖 AI Enhancement ({self.selected_config['ai_mode']})")
-            
-            if self.selected_config["lut_file"]:
-                workflow_steps.append("🎨 LUT Color Grading")
-            
-            if self.selected_config["crop_mode"] != "disabled":
-                workflow_steps.append("✂️ Auto Crop")
-            
-            if self.selected_config["watermark_enabled"]:
-                workflow_steps.append("💧 Watermark")
-            
-            workflow_steps.append("🌐 Upload ke Web (Tab Official)")
-            
-            for i, step in enumerate(workflow_steps, 1):
-                print(f"  {i}. {step}")
-            
-            # Estimated performance
-            print(f"\n⏱️ ESTIMASI PERFORMANCE:")
-            print("-" * 40)
-            processing_time = self._estimate_processing_time()
-            print(f"Processing per foto: ~{processing_time} detik")
-            print(f"Throughput: ~{3600/processing_time:.0f} foto per jam")
+            # Review ditulis sebagai satu blok bersama header di atas
+            self._buf.extend(self._review_lines())
             
             # Final confirmation
-            print(f"\n{'='*60}")
+            self._p(self._SEP60_NL)
+            self._flush()
             confirm = input("❓ Lanjutkan dengan konfigurasi ini? (Y/n): ").strip().lower()
             
-            if confirm in ['', 'y', 'yes', 'ya']:
-                print("✅ Konfigurasi dikonfirmasi!")
+            if confirm == '' or confirm in _YES:
+                self._p("✅ Konfigurasi dikonfirmasi!")
+                self._save_last_config()
                 return True
             else:
-                print("❌ Setup dibatalkan")
+                self._p("❌ Setup dibatalkan")
                 return False
             
         except Exception as e:
-            print(f"❌ Error dalam final confirmation: {e}")
+            self._p(f"❌ Error dalam final confirmation: {e}")
             return False
     
-    def _estimate_processing_time(self) -> int:
-        """Estimate processing time berdasarkan konfigurasi"""
-        base_time = 2  # Base processing time
+    def _review_lines(self) -> List[str]:
+        """Susun review konfigurasi, workflow, dan estimasi performance sebagai list baris"""
+        lines = []
+        lines.append("\n🎯 KONFIGURASI YANG DIPILIH:")
+        lines.append(self._SEP40)
+        
+        # Event Info
+        lines.append(f"📅 Event ID: {self.selected_config.event_id}")
+        
+        # AI Enhancement
+        lines.append(f"🤖 AI Enhancement: {_AI_MODE_DISPLAY[self.selected_config.ai_mode]}")
+        
+        if self.selected_config.ai_enabled:
+            lines.append(f"   🛡️ Face Protection: {'Enabled' if self.selected_config.face_protection else 'Disabled'}")
+            if self.selected_config.ai_fallback:
+                lines.append(f"   🔄 OpenCV Fallback: Enabled")
+            if self.selected_config.ai_skip_on_failure:
+                lines.append(f"   ⏭️ Skip on Failure: Enabled")
+        
+        # Image Processing
+        if self.selected_config.lut_file:
+            lines.append(f"🎨 LUT: {self.selected_config.lut_file} (intensity: {self.selected_config.lut_intensity})")
+        else:
+            lines.append(f"🎨 LUT: Disabled")
+        
+        lines.append(f"✂️ Auto Crop: {_CROP_DISPLAY[self.selected_config.crop_mode]}")
+        
+        if self.selected_config.watermark_enabled:
+            lines.append(f"💧 Watermark: {self.selected_config.watermark_file} (opacity: {self.selected_config.watermark_opacity})")
+        else:
+            lines.append(f"💧 Watermark: Disabled")
         
-        # AI Enhancement time
-        if self.selected_config["ai_mode"] == "gemini":
-            base_time += 15  # Gemini AI time
-        elif self.selected_config["ai_mode"] == "auto":
-            base_time += 10  # Average (sometimes Gemini, sometimes OpenCV)
-        elif self.selected_config["ai_mode"] == "opencv":
-            base_time += 3   # OpenCV processing time
+        # Performance & Upload
+        lines.append(f"⚡ Performance: {_PERFORMANCE_DISPLAY[self.selected_config.performance_mode]}")
+        lines.append(f"📤 Upload Quality: {_QUALITY_DISPLAY[self.selected_config.upload_quality]}")
         
-        # Face detection overhead
-        if self.selected_config["face_protection"]:
-            base_time += 1
+        # Workflow Preview
+        lines.append(f"\n🔄 WORKFLOW YANG AKAN DIJALANKAN:")
+        lines.append(self._SEP40)
+        c = self.selected_config
+        workflow_steps = [label for enabled, label in (
+            (True, "📸 Camera Capture"),
+            (True, "💾 Backup (RAW + JPG)"),
+            (c.face_protection, "👤 Face Detection"),
+            (c.ai_enabled, f"🤖 AI Enhancement ({c.ai_mode})"),
+            (c.lut_file, "🎨 LUT Color Grading"),
+            (c.crop_mode != "disabled", "✂️ Auto Crop"),
+            (c.watermark_enabled, "💧 Watermark"),
+            (True, "🌐 Upload ke Web (Tab Official)"),
+        ) if enabled]
         
-        # Image processing
-        if self.selected_config["lut_file"]:
-            base_time += 2
-        if self.selected_config["crop_mode"] != "disabled":
-            base_time += 1
-        if self.selected_config["watermark_enabled"]:
-            base_time += 1
+        for i, step in enumerate(workflow_steps, 1):
+            lines.append(_OPT_TMPL(i, step))
+        
+        # Estimated performance
+        lines.append(f"\n⏱️ ESTIMASI PERFORMANCE:")
+        lines.append(self._SEP40)
+        processing_time = self._estimate_processing_time()
+        lines.append(f"Processing per foto: ~{processing_time} detik")
+        throughput = (3600 + processing_time // 2) // processing_time  # Pembulatan integer
+        lines.append(f"Throughput: ~{throughput} foto per jam")
+        
+        return lines
+    
+    def _estimate_processing_time(self) -> int:
+        """Estimate processing time berdasarkan konfigurasi"""
+        c = self.selected_config
         
-        # Upload time (depends on quality)
-        upload_times = {"high": 5, "medium": 3, "low": 2}
-        base_time += upload_times[self.selected_config["upload_quality"]]
+        # Base 2 detik + AI + face detection + LUT/crop/watermark + upload
+        base_time = (2 + _AI_COST[c.ai_mode] + c.face_protection + bool(c.lut_file) * 2
+                     + (c.crop_mode != "disabled") + c.watermark_enabled
+                     + _UPLOAD_TIMES[c.upload_quality])
         
         # Performance mode adjustments
-        if self.selected_config["performance_mode"] == "speed":
-            base_time = int(base_time * 0.7)  # 30% faster
-        elif self.selected_config["performance_mode"] == "quality":
-            base_time = int(base_time * 1.3)  # 30% slower but better quality
+        return max(int(base_time * _PERF_MULT[c.performance_mode]), 3)  # Minimum 3 seconds
+    
+    def _validate(self):
+        """
+        Validasi selected_config terhadap _SCHEMA lalu aturan antar-field
+        
+        Raises:
+            ValueError: Jika ada field yang tidak valid (pesan berisi nama field)
+        """
+        c = self.selected_config
+        for field, rule in _SCHEMA.items():
+            value = getattr(c, field)
+            if isinstance(rule, frozenset):
+                if value not in rule:
+                    raise ValueError(f"selected_config.{field}: {value!r} bukan salah satu dari {sorted(rule)}")
+            elif isinstance(rule, tuple):
+                kind, low, high = rule
+                if isinstance(value, bool) or not isinstance(value, kind) or not low <= value <= high:
+                    raise ValueError(f"selected_config.{field}: {value!r} harus angka {low}-{high}")
+            elif not isinstance(value, rule):
+                raise ValueError(f"selected_config.{field}: {value!r} harus bertipe {rule.__name__}")
         
-        return max(base_time, 3)  # Minimum 3 seconds
+        # Aturan antar-field
+        if c.ai_enabled != (c.ai_mode != "disabled"):
+            raise ValueError(f"selected_config.ai_enabled: {c.ai_enabled!r} tidak sesuai ai_mode {c.ai_mode!r}")
+        if c.face_protection and not c.ai_enabled:
+            raise ValueError("selected_config.face_protection: butuh ai_enabled")
+        if c.lut_file is not None and not isinstance(c.lut_file, str):
+            raise ValueError(f"selected_config.lut_file: {c.lut_file!r} harus nama file atau None")
+        if c.watermark_enabled and not isinstance(c.watermark_file, str):
+            raise ValueError(f"selected_config.watermark_file: {c.watermark_file!r} harus nama file")
+    
+    def load_preset(self, preset_path: Path) -> bool:
+        """
+        Load konfigurasi dari file JSON (tanpa prompt), field yang tidak ada memakai default
+        
+        Args:
+            preset_path: Path ke file preset JSON
+            
+        Returns:
+            True jika preset valid dan sudah di-load ke selected_config
+        """
+        try:
+            data = json.loads(Path(preset_path).read_text(encoding="utf-8"))
+            if not isinstance(data, dict):
+                raise ValueError("preset harus berupa JSON object")
+            
+            self.selected_config.update(**data)
+            self.selected_config.derive_ai_fields(data.keys())
+            self._validate()
+            
+            self._p(f"✅ Preset dimuat: {preset_path}")
+            return True
+            
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            self._p(f"❌ Preset tidak valid ({preset_path}): {e}")
+            return False
+        finally:
+            self._flush()
     
     def apply_configuration(self):
         """Apply selected configuration to Config object"""
+        from config import Config
+        
         try:
+            # Validasi dulu agar Config tidak pernah ter-update sebagian
+            self._validate()
+            
+            c = self.selected_config
+            
             # AI Enhancement settings
-            Config.AI_ENHANCEMENT["enabled"] = self.selected_config["ai_enabled"]
-            Config.AI_ENHANCEMENT["mode"] = self.selected_config["ai_mode"]
-            Config.AI_ENHANCEMENT["fallback_to_opencv"] = self.selected_config["ai_fallback"]
-            Config.AI_ENHANCEMENT["skip_on_failure"] = self.selected_config["ai_skip_on_failure"]
+            Config.AI_ENHANCEMENT.update(enabled=c.ai_enabled, mode=c.ai_mode,
+                                         fallback_to_opencv=c.ai_fallback,
+                                         skip_on_failure=c.ai_skip_on_failure)
             
             # LUT settings
-            if self.selected_config["lut_file"]:
-                Config.LUT_SETTINGS["file"] = self.selected_config["lut_file"]
-                Config.LUT_SETTINGS["intensity"] = self.selected_config["lut_intensity"]
+            if c.lut_file:
+                Config.LUT_SETTINGS.update(file=c.lut_file, intensity=c.lut_intensity)
             
             # Watermark settings
-            if self.selected_config["watermark_enabled"]:
-                Config.WATERMARK["file"] = self.selected_config["watermark_file"]
-                Config.WATERMARK["opacity"] = self.selected_config["watermark_opacity"]
+            if c.watermark_enabled:
+                Config.WATERMARK.update(file=c.watermark_file, opacity=c.watermark_opacity)
             
             # Upload quality
-            Config.WEB_INTEGRATION["web_upload_quality"] = self.selected_config["upload_quality"]
+            Config.WEB_INTEGRATION["web_upload_quality"] = c.upload_quality
             
-            print("✅ Configuration applied to system")
+            self._p("✅ Configuration applied to system")
             
+        except ValueError as e:
+            self._p(f"❌ Konfigurasi tidak valid, Config tidak diubah: {e}")
         except Exception as e:
-            print(f"❌ Error applying configuration: {e}")
+            self._p(f"❌ Error applying configuration: {e}")
+        finally:
+            self._flush()
 
-def main():
+def main(argv=None):
     """Main function untuk interactive setup"""
+    parser = argparse.ArgumentParser(description="Interactive setup sistem tethered shooting")
+    parser.add_argument("--preset", "--config", dest="preset", type=Path,
+                        help="Load konfigurasi dari file JSON dan lewati semua prompt")
+    args = parser.parse_args(argv)
+    
     try:
         setup = InteractiveSetup()
-        config = setup.run_interactive_setup()
+        
+        if args.preset:
+            # Non-interactive: preset divalidasi dengan schema yang sama
+            if not setup.load_preset(args.preset):
+                return None
+            config = asdict(setup.selected_config)
+        else:
+            config = setup.run_interactive_setup()
         
         if config:
             print(f"\n🎉 Interactive setup completed successfully!")
@@ -13,25 +13,266 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import atexit
+import errno
+import hashlib
+import queue
+import shutil
+import select
 import subprocess
+import threading
 import time
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
+from typing import List, Optional
 
 # Import modules
 from config import Config
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Non-POSIX, reflink tidak tersedia
+
+# Setup logging: producer hanya enqueue LogRecord, I/O terminal di thread listener
+# (print langsung memblok capture berikutnya saat stdout lambat, mis. pipe ke journalctl)
+_log_queue = queue.Queue()
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush sisa log saat keluar
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
+# Ekstensi file RAW (dibackup ke BACKUP_RAW_DIR, sisanya ke BACKUP_JPG_DIR)
+RAW_SUFFIXES = frozenset({'.cr2', '.nef', '.arw', '.raw'})
+
+# Sentinel konfigurasi kamera: mtime = terakhir configure_camera_basic sukses
+_CONFIG_SENTINEL = Path.home() / '.cache' / 'enhance-web' / 'cam-configured'
+_CONFIG_SENTINEL_TTL = 3600  # detik
+
+# Staging capture di tmpfs (RAM): tulis gphoto2 tidak berebut disk dengan baca backup
+_STAGE_DIR = Path('/dev/shm/enhance-web')
+
+# Penanda baris output gphoto2 untuk file yang sudah didownload
+_SAVING_PREFIX = 'Saving file as '
+_ERROR_PREFIX = '*** Error'
+
+# Ukuran chunk per syscall copy_file_range/sendfile (maks 1 GiB per panggilan)
+_KERNEL_COPY_CHUNK = 1 << 30
+# Buffer fallback userspace: 1 MiB (16x lebih sedikit syscall dibanding 64 KiB default shutil)
+_COPY_BUFSIZE = 1 << 20
+_copy_state = threading.local()
+
+def _copy_buffer() -> memoryview:
+    """Buffer copy milik thread ini, dialokasi sekali lalu di-reuse"""
+    buffer = getattr(_copy_state, "buffer", None)
+    if buffer is None:
+        buffer = _copy_state.buffer = memoryview(bytearray(_COPY_BUFSIZE))
+    return buffer
+
+# errno yang berarti "syscall ini tidak bisa dipakai untuk pasangan file ini", coba metode berikutnya
+_COPY_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM})
+
+def _fastcopy(src: Path, dst: Path, digest=None):
+    """
+    Copy file secepat mungkin: copy_file_range -> sendfile -> loop readinto 1 MiB
+    
+    Args:
+        src: File sumber
+        dst: File tujuan (ditimpa jika ada)
+        digest: Objek hashlib (optional). Jika diisi, data di-hash di loop readinto
+                sambil di-copy (tanpa pass baca kedua), jalur kernel dilewati
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        # Hashing butuh data di userspace: langsung ke loop readinto
+        size = os.fstat(infd).st_size if digest is None else 0
+        copied = 0
+        
+        # 1. copy_file_range: copy di kernel (reflink/server-side copy jika FS mendukung)
+        # Beberapa FS (FUSE, ecryptfs, overlay di kernel tertentu) return 0 tanpa copy apa pun,
+        # jadi selesai hanya jika jumlah byte sama dengan ukuran sumber
+        if copied < size and hasattr(os, 'copy_file_range'):
+            try:
+                while copied < size:
+                    n = os.copy_file_range(infd, outfd, _KERNEL_COPY_CHUNK)
+                    if not n:
+                        break
+                    copied += n
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+        
+        # 2. sendfile: tetap zero-copy di kernel, offset lanjut dari posisi fd saat ini
+        if copied < size:
+            try:
+                while copied < size:
+                    n = os.sendfile(outfd, infd, None, _KERNEL_COPY_CHUNK)
+                    if not n:
+                        break
+                    copied += n
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+        
+        # 3. Fallback userspace: readinto ke buffer yang di-reuse, tanpa alokasi per chunk
+        buffer = _copy_buffer()
+        while True:
+            n = fsrc.readinto(buffer)
+            if not n:
+                break
+            chunk = buffer[:n]
+            if digest is not None:
+                digest.update(chunk)  # Data masih di cache CPU, langsung di-hash
+            fdst.write(chunk)
+    
+    shutil.copystat(src, dst)
+
+def _file_digest(path: Path, digest):
+    """
+    Hash isi file dengan buffer thread ini (untuk file yang tidak melewati _fastcopy)
+    
+    Args:
+        path: File yang di-hash
+        digest: Objek hashlib yang di-update
+    """
+    buffer = _copy_buffer()
+    with open(path, 'rb') as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(buffer[:n])
+
+def _move_file(src: Path, dst: Path, digest=None):
+    """
+    Pindahkan file: rename atomik jika satu filesystem, selain itu _fastcopy lalu hapus sumber
+    
+    Args:
+        src: File sumber
+        dst: File tujuan (ditimpa jika ada)
+        digest: Objek hashlib (optional), di-update dengan isi file
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _fastcopy(src, dst, digest)  # Hash sekalian saat copy
+        os.unlink(src)
+    else:
+        if digest is not None:
+            _file_digest(dst, digest)  # Rename tidak membaca data, hash dari page cache
+
+# ioctl FICLONE (_IOW(0x94, 9, int)): reflink CoW di btrfs/XFS
+_FICLONE = 0x40049409
+
+def _reflink_or_copy(src: Path, dst: Path):
+    """
+    Backup tanpa copy data jika src dan dst satu filesystem: reflink -> hardlink -> _fastcopy
+    
+    Args:
+        src: File sumber
+        dst: File tujuan (ditimpa jika ada)
+    """
+    # Hapus dst lama dulu: bisa jadi hardlink ke src dari backup sebelumnya,
+    # membuka dst dengan 'wb' akan ikut mengosongkan file sumber
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    
+    try:
+        same_fs = os.stat(src).st_dev == os.stat(dst.parent).st_dev
+    except OSError:
+        same_fs = False
+    
+    if same_fs:
+        # 1. Reflink: file baru (inode sendiri) yang berbagi blok data sampai ada yang ditulis
+        if fcntl is not None:
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                shutil.copystat(src, dst)
+                return
+            except OSError:
+                if os.path.lexists(dst):
+                    os.unlink(dst)
+        
+        # 2. Hardlink: nama kedua untuk inode yang sama (O(1), tanpa ruang disk tambahan)
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    
+    # 3. Beda filesystem / tidak didukung: copy data
+    _fastcopy(src, dst)
+
+def _backup_file(src: Path, dst: Path, checksum: Optional[str] = None):
+    """
+    Backup satu file (_reflink_or_copy) dan tulis checksum di sebelahnya
+    
+    Args:
+        src: File sumber
+        dst: File tujuan backup
+        checksum: SHA-256 hex isi file (optional), disimpan ke <dst>.sha256 format sha256sum
+    """
+    _reflink_or_copy(src, dst)
+    if checksum:
+        dst.with_name(dst.name + '.sha256').write_text(f"{checksum}  {dst.name}\n")
+
 class ManualTrigger:
     """Manual camera trigger menggunakan gPhoto2"""
     
-    def __init__(self):
+    def __init__(self, checksums: bool = True):
         self.capture_count = 0
-        print("📸 MANUAL TRIGGER - gPhoto2 Shutter Control")
-        print("=" * 50)
+        # SHA-256 tiap file dihitung saat dipindah dari staging (data sudah dibaca), ditulis
+        # sebagai <nama>.sha256 di folder backup untuk verifikasi/dedup
+        self.checksums = checksums
+        self._capture_dir = Config.CAPTURE_DIR
+        
+        # gphoto2 menulis ke staging tmpfs, lalu file dipindah ke CAPTURE_DIR
+        try:
+            _STAGE_DIR.mkdir(parents=True, exist_ok=True)
+            self._stage_dir = _STAGE_DIR
+        except OSError:
+            self._stage_dir = self._capture_dir  # Tanpa /dev/shm: langsung ke CAPTURE_DIR
+        self._stage_dir_str = str(self._stage_dir)  # cwd gphoto2, distringify sekali
+        self._staging = self._stage_dir != self._capture_dir
+        
+        # Direktori backup (dibuat sekali via Config.create_directories) dan namanya untuk log
+        self._raw_dir = Config.BACKUP_RAW_DIR
+        self._jpg_dir = Config.BACKUP_JPG_DIR
+        self._raw_name = f"{self._raw_dir.name}/"
+        self._jpg_name = f"{self._jpg_dir.name}/"
+        
+        # Command interactive mode -> method (bound sekali)
+        self._dispatch = {
+            key: handler
+            for keys, handler in (
+                (('c', 'capture', ''), self.capture_single),
+                (('s', 'summary'), self.get_camera_summary),
+                (('r', 'reconfig'), partial(self.configure_camera_basic, force=True)),
+            )
+            for key in keys
+        }
+        self._quit = frozenset({'q', 'quit', 'exit'})
+        
+        # Backup jalan di background (I/O murni, GIL dilepas saat copy) agar tidak menahan capture berikutnya
+        self._backup_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="backup")
+        self._backup_futures = []  # (future, nama file)
+        
+        # Proses gphoto2 --shell persistent: kamera di-init sekali, tiap shot = satu command via stdin
+        self._camera = None
+        logger.info("📸 MANUAL TRIGGER - gPhoto2 Shutter Control")
+        logger.info("=" * 50)
         
         # Buat direktori jika belum ada
         Config.create_directories()
@@ -39,42 +280,40 @@ class ManualTrigger:
     def check_camera_connection(self) -> bool:
         """Check koneksi kamera"""
         try:
-            print("🔍 Checking camera connection...")
+            logger.info("🔍 Checking camera connection...")
             
             result = subprocess.run(['gphoto2', '--auto-detect'], 
                                   capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                cameras = []
-                
-                for line in lines[2:]:  # Skip header
-                    if line.strip() and 'usb:' in line:
-                        cameras.append(line.strip())
+                # Skip header, berhenti di kamera USB pertama
+                for line in result.stdout.splitlines()[2:]:
+                    line = line.strip()
+                    if line and 'usb:' in line:
+                        logger.info(f"✅ Camera detected: {line}")
+                        return True
                 
-                if cameras:
-                    print(f"✅ Camera detected: {cameras[0]}")
-                    return True
-                else:
-                    print("❌ No camera detected")
-                    return False
+                logger.error("❌ No camera detected")
+                return False
             else:
-                print(f"❌ gPhoto2 error: {result.stderr}")
+                logger.error(f"❌ gPhoto2 error: {result.stderr}")
                 return False
                 
         except FileNotFoundError:
-            print("❌ gPhoto2 not installed. Install with:")
-            print("   Ubuntu/Debian: sudo apt-get install gphoto2")
+            logger.error("❌ gPhoto2 not installed. Install with:")
+            logger.info("   Ubuntu/Debian: sudo apt-get install gphoto2")
             return False
         except Exception as e:
-            print(f"❌ Error checking camera: {e}")
+            logger.error(f"❌ Error checking camera: {e}")
             return False
     
     def get_camera_summary(self):
         """Tampilkan summary kamera"""
+        self._stop_camera_process()
+        
         try:
-            print("\n📋 Camera Summary:")
-            print("-" * 30)
+            logger.info("\n📋 Camera Summary:")
+            logger.info("-" * 30)
             
             result = subprocess.run(['gphoto2', '--summary'], 
                                   capture_output=True, text=True, timeout=15)
@@ -84,163 +323,301 @@ class ManualTrigger:
                 lines = result.stdout.split('\n')
                 for line in lines[:10]:
                     if line.strip():
-                        print(f"  {line}")
+                        logger.info(f"  {line}")
             else:
-                print(f"  Error: {result.stderr}")
+                logger.error(f"  Error: {result.stderr}")
                 
         except Exception as e:
-            print(f"  Error: {e}")
+            logger.error(f"  Error: {e}")
     
-    def configure_camera_basic(self):
-        """Konfigurasi basic kamera untuk manual shooting"""
+    def configure_camera_basic(self, force: bool = False):
+        """
+        Konfigurasi basic kamera untuk manual shooting
+        
+        Args:
+            force: Konfigurasi ulang meski sentinel masih fresh (< 1 jam)
+        """
+        if not force:
+            try:
+                age = time.time() - _CONFIG_SENTINEL.stat().st_mtime
+            except OSError:
+                age = None
+            if age is not None and age < _CONFIG_SENTINEL_TTL:
+                logger.info(f"\n⚙️ Camera configured {age / 60:.0f} min ago, skipping (--force-reconfig to redo)")
+                return
+        
+        self._stop_camera_process()
+        
         try:
-            print("\n⚙️ Configuring camera...")
+            logger.info("\n⚙️ Configuring camera...")
             
-            config_commands = [
-                ['gphoto2', '--set-config', 'capturetarget=1'],  # Internal RAM
-                ['gphoto2', '--set-config', 'imageformat=RAW+JPEG'],
-            ]
+            # Satu proses gphoto2 untuk semua setting: kamera cukup di-init sekali
+            settings = ['capturetarget=1',  # Internal RAM
+                        'imageformat=RAW+JPEG']
+            cmd = ['gphoto2']
+            for setting in settings:
+                cmd += ['--set-config', setting]
             
-            for cmd in config_commands:
-                try:
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        print(f"  ✅ {' '.join(cmd[2:])}")
-                    else:
-                        print(f"  ⚠️ {' '.join(cmd[2:])}: {result.stderr}")
-                except Exception as e:
-                    print(f"  ⚠️ {' '.join(cmd[2:])}: {e}")
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                logger.info(f"  ✅ {', '.join(settings)}")
+                # Tandai sukses agar run berikutnya dalam 1 jam tidak init kamera lagi
+                _CONFIG_SENTINEL.parent.mkdir(parents=True, exist_ok=True)
+                _CONFIG_SENTINEL.touch()
+            else:
+                logger.warning(f"  ⚠️ {', '.join(settings)}: {result.stderr}")
             
         except Exception as e:
-            print(f"❌ Error configuring camera: {e}")
+            logger.error(f"❌ Error configuring camera: {e}")
+    
+    def _start_camera_process(self):
+        """Start gphoto2 --shell persistent (kamera di-init sekali untuk seluruh sesi)"""
+        self._camera = subprocess.Popen(
+            ['gphoto2', '--filename', 'manual_%Y%m%d_%H%M%S_%n.%C', '--shell'],
+            cwd=self._stage_dir_str, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, bufsize=0
+        )
+    
+    def _stop_camera_process(self):
+        """Hentikan gphoto2 persistent (kamera perlu dilepas untuk summary/config)"""
+        if self._camera is not None:
+            if self._camera.poll() is None:
+                try:
+                    self._camera.stdin.write(b'exit\n')
+                    self._camera.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    self._camera.kill()
+                    self._camera.wait()
+            self._camera = None
+        self._clear_stage_dir()
+    
+    def _clear_stage_dir(self):
+        """Hapus sisa file di staging (mis. download terpotong saat timeout)"""
+        if not self._staging:
+            return  # Tanpa staging ini CAPTURE_DIR, jangan dihapus
+        with os.scandir(self._stage_dir_str) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
+    
+    def _trigger_camera(self):
+        """Trigger satu shot lewat shell gphoto2 (start proses jika belum jalan)"""
+        if self._camera is None or self._camera.poll() is not None:
+            self._start_camera_process()
+        self._camera.stdin.write(b'capture-image-and-download\n')
+    
+    def _read_capture_output(self, timeout: float) -> Optional[List[str]]:
+        """
+        Baca output gphoto2 sampai shot selesai (prompt shell muncul lagi setelah
+        file tersimpan atau error). Hening tidak dianggap selesai: dengan RAW+JPEG
+        transfer file kedua bisa lambat
+        
+        Args:
+            timeout: Batas waktu sampai command selesai
+            
+        Returns:
+            List baris output, atau None jika timeout
+        """
+        fd = self._camera.stdout.fileno()
+        deadline = time.time() + timeout
+        pending = ''
+        lines = []
+        done = False  # Sudah ada file tersimpan atau error, prompt berikutnya = command selesai
+        
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return None
+            
+            chunk = os.read(fd, 65536)
+            if not chunk:  # gphoto2 berhenti
+                return lines
+            
+            *complete, pending = (pending + chunk.decode(errors='replace')).split('\n')
+            lines.extend(line.rstrip('\r') for line in complete)
+            if not done:
+                done = any(_SAVING_PREFIX in line or _ERROR_PREFIX in line for line in complete)
+            
+            # Prompt shell ("gphoto2: {...} /folder> ") tanpa newline = command selesai;
+            # prompt awal saat shell baru start muncul sebelum output command, jadi diabaikan
+            if done and pending.endswith('> '):
+                return lines
     
     def capture_single(self) -> bool:
         """Capture single foto"""
         try:
             self.capture_count += 1
-            timestamp = int(time.time())
             
-            print(f"\n📸 Capturing photo #{self.capture_count}...")
-            
-            # Capture dan download
-            capture_cmd = [
-                'gphoto2', 
-                '--capture-image-and-download',
-                '--filename', f'manual_{timestamp}_%n.%C'
-            ]
+            logger.info(f"\n📸 Capturing photo #{self.capture_count}...")
             
+            # Capture dan download lewat proses gphoto2 persistent
             start_time = time.time()
-            result = subprocess.run(capture_cmd, 
-                                  capture_output=True, text=True, 
-                                  timeout=30, cwd=Config.CAPTURE_DIR)
+            self._trigger_camera()
+            output_lines = self._read_capture_output(timeout=30)
             
             capture_time = time.time() - start_time
             
-            if result.returncode == 0:
-                print(f"✅ Capture successful in {capture_time:.2f}s")
-                
-                # Parse output untuk dapatkan file yang didownload
-                downloaded_files = []
-                for line in result.stdout.split('\n'):
-                    if 'Saving file as' in line:
-                        import re
-                        match = re.search(r'Saving file as (.+)', line)
-                        if match:
-                            filename = match.group(1).strip()
-                            file_path = Config.CAPTURE_DIR / filename
-                            if file_path.exists():
-                                downloaded_files.append(file_path)
-                                print(f"  📁 Downloaded: {filename}")
-                
-                # Backup files
-                if downloaded_files:
-                    self._backup_files(downloaded_files)
-                
-                return True
-            else:
-                print(f"❌ Capture failed: {result.stderr}")
+            if output_lines is None:
+                logger.error("❌ Capture timeout (30s)")
+                self._stop_camera_process()
                 return False
+            
+            # File yang didownload diambil dari baris "Saving file as" output gphoto2;
+            # satu scandir hanya untuk memastikan file ada (bukan stat per file)
+            saved_names = [
+                line.split(_SAVING_PREFIX, 1)[1].strip()
+                for line in output_lines if _SAVING_PREFIX in line
+            ]
+            with os.scandir(self._stage_dir_str) as entries:
+                present = {entry.name for entry in entries if entry.is_file(follow_symlinks=False)}
+            filenames = [name for name in saved_names if name in present]
+            
+            downloaded_files = []
+            checksums = {}
+            for filename in filenames:
+                file_path = self._capture_dir / filename
+                digest = hashlib.sha256() if self.checksums else None
+                if self._staging:
+                    _move_file(self._stage_dir / filename, file_path, digest)
+                elif digest is not None:
+                    _file_digest(file_path, digest)
+                if digest is not None:
+                    checksums[filename] = digest.hexdigest()
+                downloaded_files.append(file_path)
+                logger.info(f"  📁 Downloaded: {filename}")
+            
+            if not downloaded_files:
+                logger.error(f"❌ Capture failed: {' '.join(output_lines)}")
+                return False
+            
+            logger.info(f"✅ Capture successful in {capture_time:.2f}s")
+            
+            # Backup files
+            self._backup_files(downloaded_files, checksums)
+            
+            return True
                 
-        except subprocess.TimeoutExpired:
-            print("❌ Capture timeout (30s)")
-            return False
         except Exception as e:
-            print(f"❌ Capture error: {e}")
+            logger.error(f"❌ Capture error: {e}")
             return False
     
-    def _backup_files(self, files):
-        """Backup files ke folder backup"""
+    def _backup_files(self, files, checksums=None):
+        """
+        Backup files ke folder backup (async, lihat wait_backups)
+        
+        Args:
+            files: File yang dibackup
+            checksums: Nama file -> SHA-256 hex (optional)
+        """
+        checksums = checksums or {}
         try:
-            import shutil
+            # Bersihkan backup capture sebelumnya yang sudah selesai (list tidak tumbuh selama burst)
+            self._reap_backups()
             
             for file_path in files:
-                if file_path.suffix.lower() in ['.cr2', '.nef', '.arw', '.raw']:
-                    backup_dir = Config.BACKUP_RAW_DIR
+                name = file_path.name
+                if file_path.suffix.lower() in RAW_SUFFIXES:
+                    backup_dir, dir_name = self._raw_dir, self._raw_name
                 else:
-                    backup_dir = Config.BACKUP_JPG_DIR
+                    backup_dir, dir_name = self._jpg_dir, self._jpg_name
                 
-                backup_path = backup_dir / file_path.name
-                shutil.copy2(file_path, backup_path)
-                print(f"  💾 Backup: {file_path.name} -> {backup_dir.name}/")
+                future = self._backup_pool.submit(_backup_file, file_path, backup_dir / name,
+                                                  checksums.get(name))
+                self._backup_futures.append((future, name))
+                logger.info(f"  💾 Backup: {name} -> {dir_name}")
                 
         except Exception as e:
-            print(f"⚠️ Backup error: {e}")
+            logger.warning(f"⚠️ Backup error: {e}")
+    
+    def _reap_backups(self):
+        """Ambil backup yang sudah selesai tanpa blocking dan laporkan yang gagal"""
+        pending = []
+        for future, name in self._backup_futures:
+            if not future.done():
+                pending.append((future, name))
+                continue
+            # Error dilaporkan dari main thread (bukan print dari worker thread)
+            error = future.exception()
+            if error:
+                logger.warning(f"⚠️ Backup error ({name}): {error}")
+        self._backup_futures = pending
+    
+    def wait_backups(self):
+        """Tunggu semua backup selesai, laporkan yang gagal, lalu tutup thread pool"""
+        wait([future for future, _ in self._backup_futures])
+        self._reap_backups()
+        self._backup_pool.shutdown()
+    
+    def close(self):
+        """Akhiri sesi: lepas kamera dan tunggu semua backup"""
+        self._stop_camera_process()
+        self.wait_backups()
     
     def interactive_mode(self):
         """Mode interaktif untuk manual trigger"""
-        print(f"\n🎯 INTERACTIVE MANUAL TRIGGER MODE")
-        print("-" * 40)
-        print("Commands:")
-        print("  c, capture - Take a photo")
-        print("  s, summary - Show camera summary")
-        print("  r, reconfig - Reconfigure camera")
-        print("  q, quit - Exit")
-        print("-" * 40)
+        logger.info(f"\n🎯 INTERACTIVE MANUAL TRIGGER MODE")
+        logger.info("-" * 40)
+        logger.info("Commands:")
+        logger.info("  c, capture - Take a photo")
+        logger.info("  s, summary - Show camera summary")
+        logger.info("  r, reconfig - Reconfigure camera")
+        logger.info("  q, quit - Exit")
+        logger.info("-" * 40)
         
         while True:
             try:
+                _log_queue.join()  # Semua log sudah tampil sebelum prompt
                 command = input(f"\n📸 Command (capture #{self.capture_count + 1}): ").strip().lower()
                 
-                if command in ['c', 'capture', '']:
-                    self.capture_single()
-                    
-                elif command in ['s', 'summary']:
-                    self.get_camera_summary()
+                handler = self._dispatch.get(command)
+                if handler:
+                    handler()
                     
-                elif command in ['r', 'reconfig']:
-                    self.configure_camera_basic()
-                    
-                elif command in ['q', 'quit', 'exit']:
-                    print("👋 Exiting manual trigger mode")
+                elif command in self._quit:
+                    logger.info("👋 Exiting manual trigger mode")
                     break
                     
                 else:
-                    print("⚠️ Unknown command. Use: c/capture, s/summary, r/reconfig, q/quit")
+                    logger.warning("⚠️ Unknown command. Use: c/capture, s/summary, r/reconfig, q/quit")
                     
             except KeyboardInterrupt:
-                print("\n👋 Manual trigger interrupted")
+                logger.info("\n👋 Manual trigger interrupted")
                 break
             except Exception as e:
-                print(f"❌ Error: {e}")
+                logger.error(f"❌ Error: {e}")
     
     def burst_mode(self, count: int = 5, interval: float = 2.0):
-        """Burst mode - multiple captures dengan interval"""
-        print(f"\n📸 BURST MODE: {count} photos, {interval}s interval")
-        print("-" * 40)
+        """Burst mode - multiple captures dengan interval (jarak antar shutter, satu sesi gphoto2)"""
+        logger.info(f"\n📸 BURST MODE: {count} photos, {interval}s interval")
+        logger.info("-" * 40)
         
         success_count = 0
+        next_shot = time.monotonic()
         
         for i in range(count):
-            print(f"\n📸 Burst {i+1}/{count}")
+            logger.info(f"\n📸 Burst {i+1}/{count}")
             
             if self.capture_single():
                 success_count += 1
             
             if i < count - 1:  # Tidak sleep setelah foto terakhir
-                print(f"⏱️ Waiting {interval}s...")
-                time.sleep(interval)
+                # Jadwal tetap dari shot sebelumnya: waktu capture+download tidak ditambah ke interval
+                next_shot += interval
+                delay = next_shot - time.monotonic()
+                if delay > 0:
+                    logger.info(f"⏱️ Waiting {delay:.1f}s...")
+                    time.sleep(delay)
+                else:
+                    next_shot = time.monotonic()  # Capture lebih lama dari interval, langsung lanjut
         
-        print(f"\n📊 Burst completed: {success_count}/{count} successful")
+        logger.info(f"\n📊 Burst completed: {success_count}/{count} successful")
 
 def main():
     """Main function"""
@@ -255,6 +632,7 @@ Contoh penggunaan:
   python3 manual_trigger.py --capture          # Single capture
   python3 manual_trigger.py --burst 10         # Burst 10 photos
   python3 manual_trigger.py --burst 5 --interval 3  # 5 photos, 3s interval
+  python3 manual_trigger.py --force-reconfig   # Set capturetarget/imageformat lagi
         """
     )
     
@@ -277,25 +655,37 @@ Contoh penggunaan:
         help='Interval between burst photos (seconds, default: 2.0)'
     )
     
+    parser.add_argument(
+        '--force-reconfig',
+        action='store_true',
+        help='Configure camera even if it was configured in the last hour'
+    )
+    
+    parser.add_argument(
+        '--no-checksum',
+        action='store_true',
+        help='Do not write SHA-256 checksums next to backups'
+    )
+    
     args = parser.parse_args()
     
     try:
-        trigger = ManualTrigger()
+        trigger = ManualTrigger(checksums=not args.no_checksum)
         
         # Check camera connection
         if not trigger.check_camera_connection():
-            print("\n❌ Cannot proceed without camera connection")
+            logger.error("\n❌ Cannot proceed without camera connection")
             return
         
         # Get camera info
         trigger.get_camera_summary()
         
-        # Configure camera
-        trigger.configure_camera_basic()
+        # Configure camera (skip jika sudah dikonfigurasi < 1 jam lalu)
+        trigger.configure_camera_basic(force=args.force_reconfig)
         
         # Execute mode
         if args.capture:
-            print(f"\n📸 SINGLE CAPTURE MODE")
+            logger.info(f"\n📸 SINGLE CAPTURE MODE")
             trigger.capture_single()
             
         elif args.burst:
@@ -304,15 +694,18 @@ Contoh penggunaan:
         else:
             trigger.interactive_mode()
         
-        print(f"\n📊 Session Summary:")
-        print(f"  Total captures: {trigger.capture_count}")
-        print(f"  Files saved to: {Config.CAPTURE_DIR}")
-        print(f"  Backups saved to: {Config.BACKUP_RAW_DIR} & {Config.BACKUP_JPG_DIR}")
+        # Lepas kamera dan pastikan semua backup selesai sebelum keluar
+        trigger.close()
+        
+        logger.info(f"\n📊 Session Summary:")
+        logger.info(f"  Total captures: {trigger.capture_count}")
+        logger.info(f"  Files saved to: {Config.CAPTURE_DIR}")
+        logger.info(f"  Backups saved to: {Config.BACKUP_RAW_DIR} & {Config.BACKUP_JPG_DIR}")
         
     except KeyboardInterrupt:
-        print("\n👋 Manual trigger cancelled by user")
+        logger.info("\n👋 Manual trigger cancelled by user")
     except Exception as e:
-        print(f"\n❌ Fatal error: {e}")
+        logger.error(f"\n❌ Fatal error: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
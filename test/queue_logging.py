@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Logging untuk Test Scripts
+==========================
+
+Setup logging bersama untuk test yang menjalankan kerja di ThreadPoolExecutor.
+Worker thread hanya enqueue record, satu QueueListener thread yang menulis ke
+stdout (stream yang sama dengan print header/summary test), jadi worker tidak
+berebut lock stream. Record dari main thread ditulis langsung setelah antrian
+kosong, sehingga urutannya tetap sama dengan print di sekitarnya.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+class _TestQueueHandler(QueueHandler):
+    """QueueHandler dengan penulisan langsung untuk main thread dan mode tahan record per thread"""
+
+    def __init__(self, log_queue, target: logging.Handler):
+        super().__init__(log_queue)
+        self.target = target
+        self._local = threading.local()
+
+    def emit(self, record):
+        held = getattr(self._local, 'records', None)
+        if held is not None:
+            held.append(self.prepare(record))
+        elif threading.current_thread() is threading.main_thread():
+            self.write_records([record])
+        else:
+            super().emit(record)
+
+    def write_records(self, records):
+        """Tulis record langsung ke stream, setelah semua record worker yang antri tampil"""
+        self.queue.join()
+        for record in records:
+            self.target.handle(record)
+
+    def run_grouped(self, func, *args):
+        """Jalankan func(*args) dengan record thread ini ditahan; return (hasil, records)"""
+        records = self._local.records = []
+        try:
+            return func(*args), records
+        finally:
+            self._local.records = None
+
+_log_queue = queue.Queue()
+_handler = None
+
+def setup_logging():
+    """Pasang QueueHandler di root logger dan start listener (sekali per proses)"""
+    global _handler
+    if _handler is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    listener = QueueListener(_log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush sisa log saat keluar
+
+    _handler = _TestQueueHandler(_log_queue, stream_handler)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(_handler)
+
+def flush_logs():
+    """Tunggu sampai semua record yang antri sudah ditulis"""
+    _log_queue.join()
+
+def run_grouped(func, *args):
+    """
+    Jalankan func(*args) dengan semua log thread ini ditahan (untuk test paralel)
+
+    Args:
+        func: Fungsi test
+        *args: Argumen untuk func
+
+    Returns:
+        Tuple (hasil func, list record) - tulis record lewat write_records
+    """
+    return _handler.run_grouped(func, *args)
+
+def write_records(records):
+    """Tulis record hasil run_grouped (dipanggil dari main thread, sesuai urutan yang diinginkan)"""
+    _handler.write_records(records)
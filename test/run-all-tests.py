@@ -10,12 +10,15 @@ Script untuk menjalankan semua test sistem tethered shooting secara berurutan.
 
 import sys
 import os
+from pathlib import Path
 import subprocess
+import threading
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Root proyek (parent dari test/), dihitung sekali dan didahulukan di sys.path
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
 
 class MasterTestRunner:
     """Runner untuk semua test sistem"""
@@ -23,6 +26,7 @@ class MasterTestRunner:
     def __init__(self):
         self.test_dir = Path(__file__).parent
         self.test_results = {}
+        self._output_lock = threading.Lock()  # Mode paralel: satu blok output per test
         
         # Daftar test scripts dalam urutan yang logis
         self.test_scripts = [
@@ -38,55 +42,90 @@ class MasterTestRunner:
         print("Menjalankan semua test sistem tethered shooting")
         print("=" * 60)
     
-    def run_single_test(self, test_name: str, script_name: str) -> bool:
-        """Jalankan single test script"""
+    def _write(self, *blocks):
+        """Tulis beberapa blok (str/bytes) ke stdout secara berurutan tanpa diselingi thread lain"""
+        with self._output_lock:
+            sys.stdout.flush()
+            out = sys.stdout.buffer
+            for block in blocks:
+                out.write(block.encode() if isinstance(block, str) else block)
+            out.flush()
+    
+    def run_single_test(self, test_name: str, script_name: str, stream: bool = True) -> bool:
+        """
+        Jalankan single test script
+        
+        Args:
+            test_name: Nama test
+            script_name: File script di folder test
+            stream: True = output tampil real time, False = ditahan lalu ditulis
+                    sekaligus setelah selesai (untuk mode paralel)
+        """
+        separator = "=" * 60
+        header = f"\n{separator}\n🚀 RUNNING: {test_name}\n📄 Script: {script_name}\n{separator}\n"
+        
         try:
-            print(f"\n{'='*60}")
-            print(f"🚀 RUNNING: {test_name}")
-            print(f"📄 Script: {script_name}")
-            print(f"{'='*60}")
-            
             script_path = self.test_dir / script_name
             
             if not script_path.exists():
-                print(f"❌ Test script tidak ditemukan: {script_path}")
+                self._write(header, f"❌ Test script tidak ditemukan: {script_path}\n")
                 return False
             
+            if stream:
+                self._write(header)
+            
             # Run test script
             start_time = time.time()
             
-            result = subprocess.run(
+            # Output test dibaca per chunk (maks 1 MiB) dan ditulis bulk ke stdout,
+            # bukan baris per baris langsung dari child ke terminal
+            process = subprocess.Popen(
                 [sys.executable, str(script_path)],
-                capture_output=False,  # Show output in real time
-                text=True,
-                cwd=str(self.test_dir.parent)  # Run from parent directory
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                cwd=str(self.test_dir.parent),  # Run from parent directory
+                # stdout child berupa pipe -> Python block-buffer; unbuffered agar output tetap streaming
+                env={**os.environ, "PYTHONUNBUFFERED": "1"}
             )
             
+            captured = bytearray()
+            while True:
+                chunk = process.stdout.read1(1 << 20)
+                if not chunk:
+                    break
+                if stream:
+                    self._write(chunk)
+                else:
+                    captured += chunk
+            returncode = process.wait()
+            
             end_time = time.time()
             duration = end_time - start_time
             
-            success = result.returncode == 0
+            success = returncode == 0
             
-            print(f"\n{'='*60}")
-            if success:
-                print(f"✅ {test_name} PASSED")
+            status = f"✅ {test_name} PASSED" if success else f"❌ {test_name} FAILED"
+            footer = f"\n{separator}\n{status}\n⏱️  Duration: {duration:.2f} seconds\n{separator}\n"
+            
+            if stream:
+                self._write(footer)
             else:
-                print(f"❌ {test_name} FAILED")
-            print(f"⏱️  Duration: {duration:.2f} seconds")
-            print(f"{'='*60}")
+                self._write(header, captured, footer)
             
             return success
             
         except Exception as e:
-            print(f"❌ Error running {test_name}: {e}")
+            self._write(f"❌ Error running {test_name}: {e}\n")
             return False
     
-    def run_all_tests(self, stop_on_failure: bool = False) -> bool:
-        """Jalankan semua test"""
+    def run_all_tests(self, stop_on_failure: bool = False, parallel: bool = False) -> bool:
+        """Jalankan semua test (parallel=True: semua script jalan bersamaan)"""
         print(f"\n🎯 Starting comprehensive system testing...")
         print(f"📋 Total tests to run: {len(self.test_scripts)}")
         
-        if stop_on_failure:
+        if parallel:
+            print("⚡ Mode: Parallel (stop-on-failure tidak berlaku)")
+        elif stop_on_failure:
             print("⚠️  Mode: Stop on first failure")
         else:
             print("🔄 Mode: Run all tests regardless of failures")
@@ -97,6 +136,12 @@ class MasterTestRunner:
         passed = 0
         failed = 0
         
+        if parallel:
+            passed, failed = self._run_parallel()
+            overall_duration = time.time() - overall_start_time
+            self.print_final_summary(passed, failed, overall_duration)
+            return failed == 0
+        
         for i, (test_name, script_name) in enumerate(self.test_scripts, 1):
             print(f"\n📍 TEST {i}/{len(self.test_scripts)}")
             
@@ -111,11 +156,6 @@ class MasterTestRunner:
                 if stop_on_failure:
                     print(f"\n🛑 Stopping due to failure in: {test_name}")
                     break
-            
-            # Short pause between tests
-            if i < len(self.test_scripts):
-                print(f"\n⏳ Waiting 3 seconds before next test...")
-                time.sleep(3)
         
         overall_duration = time.time() - overall_start_time
         
@@ -124,6 +164,24 @@ class MasterTestRunner:
         
         return failed == 0
     
+    def _run_parallel(self):
+        """Jalankan semua test bersamaan; kerja sebenarnya di proses child, jadi thread cukup"""
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(self.test_scripts)) as executor:
+            futures = {
+                executor.submit(self.run_single_test, test_name, script_name, False): test_name
+                for test_name, script_name in self.test_scripts
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Simpan hasil dalam urutan daftar test (bukan urutan selesai)
+        for test_name, _ in self.test_scripts:
+            self.test_results[test_name] = results[test_name]
+        
+        passed = sum(results.values())
+        return passed, len(results) - passed
+    
     def print_final_summary(self, passed: int, failed: int, duration: float):
         """Print final test summary"""
         total = passed + failed
@@ -211,6 +269,7 @@ def main():
 Contoh penggunaan:
   python3 run-all-tests.py                           # Jalankan semua test
   python3 run-all-tests.py --stop-on-failure        # Stop pada test pertama yang gagal
+  python3 run-all-tests.py --parallel               # Jalankan semua test bersamaan
   python3 run-all-tests.py --list                   # Tampilkan daftar test
   python3 run-all-tests.py --tests "Database" "Event"  # Jalankan test spesifik
         """
@@ -222,6 +281,12 @@ Contoh penggunaan:
         help='Stop pada test pertama yang gagal'
     )
     
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Jalankan semua test bersamaan'
+    )
+    
     parser.add_argument(
         '--list',
         action='store_true',
@@ -248,7 +313,7 @@ Contoh penggunaan:
         if args.tests:
             success = runner.run_specific_tests(args.tests)
         else:
-            success = runner.run_all_tests(stop_on_failure=args.stop_on_failure)
+            success = runner.run_all_tests(stop_on_failure=args.stop_on_failure, parallel=args.parallel)
         
         sys.exit(0 if success else 1)
         
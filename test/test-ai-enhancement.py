@@ -10,13 +10,16 @@ Test Google Gemini AI enhancement, image processing pipeline, dan fallback mecha
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+# Root proyek (parent dari test/), dihitung sekali dan didahulukan di sys.path
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
 
 import logging
 import time
 import cv2
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
 # Import modules
@@ -24,20 +27,70 @@ from config import Config
 from gemini_enhancer import GeminiImageEnhancer
 from image_processor import ImageProcessor
 from face_detection import FaceProtectionMask
+from queue_logging import setup_logging, flush_logs
 
-# Setup logging untuk test
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Setup logging untuk test (QueueHandler/QueueListener bersama, lihat queue_logging.py)
+setup_logging()
 logger = logging.getLogger(__name__)
 
+# Kualitas JPEG untuk file output test
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85]
+
+# Sample LUT 33^3 entry, tiap baris >= 20 byte; file lebih kecil berarti tulisan terpotong
+_SAMPLE_LUT_SIZE = 33
+_SAMPLE_LUT_MIN_BYTES = _SAMPLE_LUT_SIZE ** 3 * 20
+_SAMPLE_LUT_HEADER = '# Sample LUT for Testing\n'
+
+def _sample_lut_missing(lut_file: Path) -> bool:
+    """
+    True jika LUT belum ada, atau sample LUT buatan test ini terpotong
+    
+    Ukuran hanya dicek untuk file ber-header sample; LUT asli milik user
+    (ukuran grid bisa lebih kecil dari 33) tidak pernah ditimpa.
+    """
+    try:
+        size = lut_file.stat().st_size
+        with open(lut_file, 'r') as f:
+            is_sample = f.readline() == _SAMPLE_LUT_HEADER
+    except FileNotFoundError:
+        return True
+    return is_sample and size < _SAMPLE_LUT_MIN_BYTES
+
+def _encode_jpg(image: np.ndarray) -> bytes:
+    """Encode gambar ke JPEG di memori"""
+    ok, buffer = cv2.imencode('.jpg', image, _JPEG_PARAMS)
+    if not ok:
+        raise ValueError("Gagal encode JPEG")
+    return buffer.tobytes()
+
+def _write_outputs(outputs):
+    """Tulis semua (path, bytes) hasil encode sekaligus di akhir test"""
+    for path, data in outputs:
+        path.write_bytes(data)
+
 class AIEnhancementTester:
     """Test AI enhancement dan image processing"""
     
+    _cached_font = None  # Font watermark, di-load sekali dan dipakai semua instance
+    
+    @classmethod
+    def _get_font(cls):
+        """Ambil font watermark (TTF diparse sekali, fallback ke font default PIL)"""
+        if cls._cached_font is None:
+            try:
+                cls._cached_font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 24)
+            except OSError:
+                cls._cached_font = ImageFont.load_default()
+        return cls._cached_font
+    
     def __init__(self):
         self.test_results = {}
         self.ai_enhancer = None
         self.image_processor = None
         self.face_detector = None
         self.test_images = {}
+        self.test_images_decoded = {}  # Array test image di memori, tidak di-imread ulang per test
+        self._rng = np.random.default_rng(0)  # PCG64, seed tetap agar test image reproducible
         print("🤖 AI ENHANCEMENT & IMAGE PROCESSING TESTER")
         print("=" * 50)
     
@@ -86,49 +139,56 @@ class AIEnhancementTester:
             
             test_dir = Config.TEMP_DIR / "ai_test"
             test_dir.mkdir(exist_ok=True)
+            outputs = []
             
             # === Blurry Image ===
             print("  📷 Creating blurry image...")
-            blurry_img = np.ones((600, 800, 3), dtype=np.uint8) * 100
+            blurry_img = np.full((600, 800, 3), 100, dtype=np.uint8)
             
             # Add content
             cv2.rectangle(blurry_img, (100, 100), (300, 300), (200, 150, 100), -1)
             cv2.circle(blurry_img, (500, 200), 80, (150, 200, 250), -1)
             cv2.rectangle(blurry_img, (400, 350), (600, 500), (100, 200, 150), -1)
             
-            # Apply blur
-            blurry_img = cv2.GaussianBlur(blurry_img, (15, 15), 0)
+            # Apply blur: Gaussian 15x15 sebagai dua pass 1D (horizontal lalu vertikal)
+            kernel = cv2.getGaussianKernel(15, 0)
+            blurry_img = cv2.sepFilter2D(blurry_img, -1, kernel, kernel)
             
             blurry_path = test_dir / "blurry_test.jpg"
-            cv2.imwrite(str(blurry_path), blurry_img)
+            outputs.append((blurry_path, _encode_jpg(blurry_img)))
             self.test_images['blurry'] = blurry_path
+            self.test_images_decoded['blurry'] = blurry_img
             
             # === Noisy Image ===
             print("  📡 Creating noisy image...")
-            clean_img = np.ones((500, 700, 3), dtype=np.uint8) * 120
+            clean_img = np.full((500, 700, 3), 120, dtype=np.uint8)
             cv2.rectangle(clean_img, (50, 50), (250, 250), (180, 160, 140), -1)
             cv2.circle(clean_img, (450, 300), 100, (160, 180, 200), -1)
             
-            # Add noise
-            noise = np.random.randint(0, 50, clean_img.shape, dtype=np.uint8)
-            noisy_img = cv2.add(clean_img, noise)
+            # Add noise (in-place, saturating)
+            noise = self._rng.integers(0, 50, clean_img.shape, dtype=np.uint8)
+            cv2.add(clean_img, noise, dst=clean_img)
+            noisy_img = clean_img
             
             noisy_path = test_dir / "noisy_test.jpg"
-            cv2.imwrite(str(noisy_path), noisy_img)
+            outputs.append((noisy_path, _encode_jpg(noisy_img)))
             self.test_images['noisy'] = noisy_path
+            self.test_images_decoded['noisy'] = noisy_img
             
             # === Low Contrast Image ===
             print("  🌫️  Creating low contrast image...")
-            low_contrast = np.ones((400, 600, 3), dtype=np.uint8) * 128
+            low_contrast = np.full((400, 600, 3), 128, dtype=np.uint8)
             
             # Very subtle differences
             cv2.rectangle(low_contrast, (100, 100), (300, 250), (138, 138, 138), -1)
             cv2.circle(low_contrast, (400, 200), 60, (118, 118, 118), -1)
             
             low_contrast_path = test_dir / "low_contrast_test.jpg"
-            cv2.imwrite(str(low_contrast_path), low_contrast)
+            outputs.append((low_contrast_path, _encode_jpg(low_contrast)))
             self.test_images['low_contrast'] = low_contrast_path
+            self.test_images_decoded['low_contrast'] = low_contrast
             
+            _write_outputs(outputs)
             print(f"  ✅ Created {len(self.test_images)} test images for enhancement")
             
             return True
@@ -137,6 +197,24 @@ class AIEnhancementTester:
             print(f"  ❌ Error creating test images: {e}")
             return False
     
+    def _map_images(self, func, items):
+        """
+        Jalankan func untuk tiap test image secara paralel (hasil tetap urut seperti items)
+        
+        Args:
+            func: Fungsi per image, dipanggil dengan satu item (name, value)
+            items: Dict test image (nama -> path/array)
+            
+        Returns:
+            List hasil func
+        """
+        items = list(items.items())
+        workers = max(1, min(len(items), Config.PERFORMANCE["max_workers"]))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(func, items))
+        flush_logs()  # Log dari worker tampil sebelum hasil di-print
+        return results
+    
     def test_ai_enhancement_fallback(self) -> bool:
         """Test AI enhancement dengan fallback ke OpenCV"""
         try:
@@ -148,21 +226,31 @@ class AIEnhancementTester:
             
             test_dir = Config.TEMP_DIR / "ai_test"
             
-            for image_name, image_path in self.test_images.items():
-                print(f"  🔄 Testing enhancement for {image_name}...")
-                
+            def enhance_one(item):
+                image_name, image_path = item
                 output_path = test_dir / f"enhanced_{image_name}.jpg"
                 
-                start_time = time.time()
+                t0 = time.perf_counter_ns()
                 success, result_path = self.ai_enhancer.enhance_image(image_path, output_path)
-                enhancement_time = time.time() - start_time
+                dt_ms = (time.perf_counter_ns() - t0) / 1e6
+                return image_name, image_path, success, result_path, dt_ms
+            
+            # Request Gemini (I/O) untuk semua image berjalan bersamaan
+            results = self._map_images(enhance_one, self.test_images)
+            
+            # Ukuran input dan hasil (semua di test_dir) dari satu scandir, bukan stat per file
+            with os.scandir(test_dir) as entries:
+                sizes = {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+            
+            for image_name, image_path, success, result_path, dt_ms in results:
+                print(f"  🔄 Testing enhancement for {image_name}...")
                 
-                if success and result_path and result_path.exists():
-                    print(f"    ✅ Enhancement successful in {enhancement_time:.2f}s")
+                if success and result_path and result_path.name in sizes:
+                    print(f"    ✅ Enhancement successful in {dt_ms:.1f}ms")
                     
                     # Compare file sizes
-                    original_size = image_path.stat().st_size
-                    enhanced_size = result_path.stat().st_size
+                    original_size = sizes[image_path.name]
+                    enhanced_size = sizes[result_path.name]
                     print(f"    📊 Size: {original_size} → {enhanced_size} bytes")
                     
                 else:
@@ -184,60 +272,140 @@ class AIEnhancementTester:
                 print("  ❌ Required components not initialized")
                 return False
             
-            # Create sample LUT if not exists
-            lut_file = Config.PRESETS_DIR / Config.LUT_SETTINGS["file"]
-            if not lut_file.exists():
+            # Create sample LUT if not exists (atau terpotong karena crash saat generate);
+            # nama file kosong berarti LUT memang tidak dikonfigurasi
+            lut_name = Config.LUT_SETTINGS["file"]
+            if lut_name and _sample_lut_missing(Config.PRESETS_DIR / lut_name):
                 print("  📁 Creating sample LUT file...")
                 self._create_sample_lut()
             
             test_dir = Config.TEMP_DIR / "ai_test"
             
-            for image_name, image_path in self.test_images.items():
+            def lut_one(item):
+                image_name, image = item
+                return image_name, self.image_processor.apply_lut(image)
+            
+            # OpenCV/NumPy melepas GIL, image diproses paralel
+            outputs = []
+            for image_name, lut_result in self._map_images(lut_one, self.test_images_decoded):
                 print(f"  🎯 Testing LUT for {image_name}...")
                 
-                image = cv2.imread(str(image_path))
-                if image is None:
-                    continue
-                
-                # Apply LUT
-                lut_result = self.image_processor.apply_lut(image)
-                
                 if lut_result is not None:
                     lut_output = test_dir / f"lut_{image_name}.jpg"
-                    cv2.imwrite(str(lut_output), lut_result)
+                    outputs.append((lut_output, _encode_jpg(lut_result)))
                     print(f"    ✅ LUT applied successfully")
                 else:
                     print(f"    ❌ LUT application failed")
                     return False
             
+            _write_outputs(outputs)
             return True
             
         except Exception as e:
             print(f"  ❌ Error testing LUT application: {e}")
             return False
     
+    def test_lut_channel_order(self) -> bool:
+        """Test urutan axis .cube (R berubah paling cepat) dengan LUT non-simetris"""
+        try:
+            print("\n🔀 Testing LUT Channel Order...")
+            
+            if not self.image_processor:
+                print("  ❌ Image processor not initialized")
+                return False
+            
+            # LUT tukar channel: output (R, G, B) = input (B, G, R). LUT identitas
+            # tidak bisa menangkap axis R/B yang tertukar, LUT ini bisa.
+            lut_size = 17
+            lut_file = Config.TEMP_DIR / "ai_test" / "swap_rb.cube"
+            lut_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(lut_file, 'w') as f:
+                f.write('TITLE "Swap R/B"\n')
+                f.write(f'LUT_3D_SIZE {lut_size}\n\n')
+                for b in range(lut_size):
+                    for g in range(lut_size):
+                        for r in range(lut_size):
+                            f.write(f'{b / (lut_size - 1):.6f} {g / (lut_size - 1):.6f} '
+                                    f'{r / (lut_size - 1):.6f}\n')
+            
+            # Pixel merah murni (BGR) harus menjadi biru murni, dan sebaliknya
+            image = np.zeros((2, 2, 3), dtype=np.uint8)
+            image[0, :] = (0, 0, 255)
+            image[1, :] = (255, 0, 0)
+            result = self.image_processor.apply_lut(image, lut_path=lut_file)
+            
+            expected = image[:, :, ::-1]
+            max_diff = int(np.abs(result.astype(np.int16) - expected).max())
+            if max_diff > 1:
+                print(f"    ❌ R/B axes swapped (max diff {max_diff}): {result[:, 0].tolist()}")
+                return False
+            
+            print("    ✅ Non-symmetric LUT applied with correct channel order")
+            return True
+            
+        except Exception as e:
+            print(f"  ❌ Error testing LUT channel order: {e}")
+            return False
+    
+    def test_lut_identity(self) -> bool:
+        """Test LUT identitas memetakan semua 256 level ke dirinya sendiri (tanpa bias pembulatan)"""
+        try:
+            print("\n🎯 Testing LUT Identity Round-Trip...")
+            
+            if not self.image_processor:
+                print("  ❌ Image processor not initialized")
+                return False
+            
+            # LUT identitas 33^3, urutan .cube [B][G][R]
+            lut_size = _SAMPLE_LUT_SIZE
+            idx = np.arange(lut_size, dtype=np.float64) / (lut_size - 1)
+            b, g, r = np.meshgrid(idx, idx, idx, indexing='ij')
+            lut_file = Config.TEMP_DIR / "ai_test" / "identity.cube"
+            lut_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(lut_file, 'w') as f:
+                f.write('TITLE "Identity"\n')
+                f.write(f'LUT_3D_SIZE {lut_size}\n\n')
+                np.savetxt(f, np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1), fmt='%.6f')
+            
+            # Semua level 0-255 di tiap channel, dengan kombinasi channel berbeda
+            levels = np.arange(256, dtype=np.uint8)
+            image = np.stack([levels, levels[::-1], np.roll(levels, 85)], axis=-1)[None]
+            result = self.image_processor.apply_lut(image, lut_path=lut_file)
+            
+            mismatch = np.flatnonzero((result != image).any(axis=-1))
+            if mismatch.size:
+                first = int(mismatch[0])
+                print(f"    ❌ {mismatch.size} levels changed, e.g. {image[0, first].tolist()} "
+                      f"→ {result[0, first].tolist()}")
+                return False
+            
+            print("    ✅ Identity LUT preserves all 256 levels")
+            return True
+            
+        except Exception as e:
+            print(f"  ❌ Error testing LUT identity: {e}")
+            return False
+    
     def _create_sample_lut(self):
         """Create sample LUT file for testing"""
-        lut_size = 33
-        lut_data = []
+        lut_size = _SAMPLE_LUT_SIZE
         
-        for b in range(lut_size):
-            for g in range(lut_size):
-                for r in range(lut_size):
-                    r_val = r / (lut_size - 1)
-                    g_val = g / (lut_size - 1)
-                    b_val = b / (lut_size - 1)
-                    lut_data.append(f'{r_val:.6f} {g_val:.6f} {b_val:.6f}')
+        # Identity LUT: meshgrid [B][G][R] agar R berubah paling cepat (urutan .cube)
+        idx = np.arange(lut_size, dtype=np.float64) / (lut_size - 1)
+        b, g, r = np.meshgrid(idx, idx, idx, indexing='ij')
+        table = np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1)
         
+        # Tulis ke file sementara lalu rename atomik, agar pembaca tidak melihat file setengah jadi
         lut_file = Config.PRESETS_DIR / Config.LUT_SETTINGS["file"]
-        with open(lut_file, 'w') as f:
-            f.write('# Sample LUT for Testing\n')
+        tmp_file = lut_file.with_suffix('.cube.tmp')
+        with open(tmp_file, 'w') as f:
+            f.write(_SAMPLE_LUT_HEADER)
             f.write('TITLE "Test LUT"\n')
-            f.write('LUT_3D_SIZE 33\n')
+            f.write(f'LUT_3D_SIZE {lut_size}\n')
             f.write('DOMAIN_MIN 0.0 0.0 0.0\n')
             f.write('DOMAIN_MAX 1.0 1.0 1.0\n\n')
-            for line in lut_data:
-                f.write(line + '\n')
+            np.savetxt(f, table, fmt='%.6f')
+        os.replace(tmp_file, lut_file)
     
     def test_auto_crop(self) -> bool:
         """Test auto crop functionality"""
@@ -250,28 +418,27 @@ class AIEnhancementTester:
             
             test_dir = Config.TEMP_DIR / "ai_test"
             
-            for image_name, image_path in self.test_images.items():
-                print(f"  📐 Testing crop for {image_name}...")
-                
-                image = cv2.imread(str(image_path))
-                if image is None:
-                    continue
-                
-                original_shape = image.shape[:2]
+            def crop_one(item):
+                image_name, image = item
                 orientation = self.image_processor.detect_orientation(image)
-                
-                cropped = self.image_processor.auto_crop(image)
+                return image_name, image.shape[:2], orientation, self.image_processor.auto_crop(image)
+            
+            outputs = []
+            for image_name, original_shape, orientation, cropped in \
+                    self._map_images(crop_one, self.test_images_decoded):
+                print(f"  📐 Testing crop for {image_name}...")
                 
                 if cropped is not None:
                     cropped_shape = cropped.shape[:2]
                     crop_output = test_dir / f"cropped_{image_name}.jpg"
-                    cv2.imwrite(str(crop_output), cropped)
+                    outputs.append((crop_output, _encode_jpg(cropped)))
                     
                     print(f"    ✅ {orientation}: {original_shape} → {cropped_shape}")
                 else:
                     print(f"    ❌ Crop failed")
                     return False
             
+            _write_outputs(outputs)
             return True
             
         except Exception as e:
@@ -295,23 +462,23 @@ class AIEnhancementTester:
             
             test_dir = Config.TEMP_DIR / "ai_test"
             
-            for image_name, image_path in self.test_images.items():
+            def watermark_one(item):
+                image_name, image = item
+                return image_name, self.image_processor.apply_watermark(image)
+            
+            outputs = []
+            for image_name, watermarked in self._map_images(watermark_one, self.test_images_decoded):
                 print(f"  🏷️  Testing watermark for {image_name}...")
                 
-                image = cv2.imread(str(image_path))
-                if image is None:
-                    continue
-                
-                watermarked = self.image_processor.apply_watermark(image)
-                
                 if watermarked is not None:
                     watermark_output = test_dir / f"watermarked_{image_name}.jpg"
-                    cv2.imwrite(str(watermark_output), watermarked)
+                    outputs.append((watermark_output, _encode_jpg(watermarked)))
                     print(f"    ✅ Watermark applied successfully")
                 else:
                     print(f"    ❌ Watermark application failed")
                     return False
             
+            _write_outputs(outputs)
             return True
             
         except Exception as e:
@@ -320,16 +487,10 @@ class AIEnhancementTester:
     
     def _create_sample_watermark(self):
         """Create sample watermark for testing"""
-        from PIL import Image, ImageDraw, ImageFont
-        
         width, height = 300, 80
         img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
-        
-        try:
-            font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 24)
-        except:
-            font = ImageFont.load_default()
+        font = self._get_font()
         
         text = 'Test Watermark'
         bbox = draw.textbbox((0, 0), text, font=font)
@@ -341,8 +502,9 @@ class AIEnhancementTester:
         
         draw.text((x, y), text, fill=(255, 255, 255, 200), font=font)
         
+        # Kompresi PNG minimum, file test ini sekali pakai
         watermark_file = Config.WATERMARKS_DIR / Config.WATERMARK["file"]
-        img.save(watermark_file)
+        img.save(watermark_file, format='PNG', optimize=False, compress_level=1)
     
     def run_all_tests(self) -> bool:
         """Jalankan semua test AI enhancement dan processing"""
@@ -354,6 +516,8 @@ class AIEnhancementTester:
             ("Create Test Images", self.create_test_images_with_issues),
             ("AI Enhancement Fallback", self.test_ai_enhancement_fallback),
             ("LUT Application", self.test_lut_application),
+            ("LUT Channel Order", self.test_lut_channel_order),
+            ("LUT Identity", self.test_lut_identity),
             ("Auto Crop", self.test_auto_crop),
             ("Watermark Application", self.test_watermark_application)
         ]
@@ -10,19 +10,34 @@ Test koneksi ke database, environment variables, dan konfigurasi dasar sistem.
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+# Root proyek (parent dari test/), dihitung sekali dan didahulukan di sys.path
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
 
 import logging
 import time
-from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import konfigurasi
 from config import Config
+from queue_logging import setup_logging, run_grouped, write_records
 
-# Setup logging untuk test
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Setup logging untuk test (QueueHandler/QueueListener bersama, lihat queue_logging.py)
+setup_logging()
 logger = logging.getLogger(__name__)
 
+# Environment variables wajib, dan yang nilainya di-mask saat ditampilkan
+_CRITICAL_VARS = (
+    'GOOGLE_API_KEY',
+    'NEXT_PUBLIC_SUPABASE_URL',
+    'NEXT_PUBLIC_SUPABASE_ANON_KEY',
+    'WEB_API_BASE_URL',
+    'JWT_SECRET',
+)
+_SECRET_VARS = frozenset({'GOOGLE_API_KEY', 'NEXT_PUBLIC_SUPABASE_ANON_KEY', 'JWT_SECRET'})
+
 class DatabaseTester:
     """Test database connection dan konfigurasi"""
     
@@ -34,73 +49,67 @@ class DatabaseTester:
     def test_environment_variables(self) -> bool:
         """Test environment variables dari .env"""
         try:
-            print("\n📋 Testing Environment Variables...")
+            logger.info("📋 Testing Environment Variables...")
             
             # Test critical environment variables
-            critical_vars = [
-                'GOOGLE_API_KEY',
-                'NEXT_PUBLIC_SUPABASE_URL', 
-                'NEXT_PUBLIC_SUPABASE_ANON_KEY',
-                'WEB_API_BASE_URL',
-                'JWT_SECRET'
-            ]
-            
+            environ = os.environ
             missing_vars = []
-            for var in critical_vars:
-                value = os.getenv(var)
+            for var in _CRITICAL_VARS:
+                value = environ.get(var)
                 if not value:
                     missing_vars.append(var)
                 else:
                     # Mask sensitive values
-                    if 'KEY' in var or 'SECRET' in var:
+                    if var in _SECRET_VARS:
                         masked_value = value[:8] + "*" * (len(value) - 8) if len(value) > 8 else "***"
-                        print(f"  ✅ {var}: {masked_value}")
+                        logger.info("  ✅ %s: %s", var, masked_value)
                     else:
-                        print(f"  ✅ {var}: {value}")
+                        logger.info("  ✅ %s: %s", var, value)
             
             if missing_vars:
-                print(f"  ❌ Missing variables: {', '.join(missing_vars)}")
+                logger.error("  ❌ Missing variables: %s", ', '.join(missing_vars))
                 return False
             
-            print("  ✅ All critical environment variables loaded")
+            logger.info("  ✅ All critical environment variables loaded")
             return True
             
         except Exception as e:
-            print(f"  ❌ Error testing environment variables: {e}")
+            logger.error("  ❌ Error testing environment variables: %s", e)
             return False
     
     def test_config_validation(self) -> bool:
         """Test konfigurasi sistem"""
         try:
-            print("\n⚙️  Testing Configuration Validation...")
+            logger.info("⚙️  Testing Configuration Validation...")
             
             # Test konfigurasi basic
-            print(f"  🤖 AI Model: {Config.GEMINI_MODEL}")
-            print(f"  📁 Base Directory: {Config.BASE_DIR}")
-            print(f"  🔧 Max Workers: {Config.PERFORMANCE['max_workers']}")
-            print(f"  💾 Memory Limit: {Config.PERFORMANCE['memory_limit_mb']} MB")
+            perf_config = Config.PERFORMANCE
+            logger.info("  🤖 AI Model: %s", Config.GEMINI_MODEL)
+            logger.info("  📁 Base Directory: %s", Config.BASE_DIR)
+            logger.info("  🔧 Max Workers: %s", perf_config['max_workers'])
+            logger.info("  💾 Memory Limit: %s MB", perf_config['memory_limit_mb'])
             
             # Validasi konfigurasi
-            print("  🔍 Validating configuration...")
+            logger.info("  🔍 Validating configuration...")
             errors = Config.validate_config()
             
             if errors:
-                print("  ⚠️  Configuration warnings:")
+                logger.warning("  ⚠️  Configuration warnings:")
                 for error in errors:
-                    print(f"    - {error}")
+                    logger.warning("    - %s", error)
             else:
-                print("  ✅ Configuration validation passed")
+                logger.info("  ✅ Configuration validation passed")
             
             return True
             
         except Exception as e:
-            print(f"  ❌ Error testing configuration: {e}")
+            logger.error("  ❌ Error testing configuration: %s", e)
             return False
     
     def test_directories_creation(self) -> bool:
         """Test pembuatan direktori sistem"""
         try:
-            print("\n📁 Testing Directory Creation...")
+            logger.info("📁 Testing Directory Creation...")
             
             # Buat direktori
             Config.create_directories()
@@ -118,81 +127,93 @@ class DatabaseTester:
                 Config.MODELS_DIR
             ]
             
+            # Kelompokkan per parent: satu scandir per parent, bukan satu stat per direktori
+            children = defaultdict(set)
+            for parent in {directory.parent for directory in required_dirs}:
+                try:
+                    with os.scandir(parent) as entries:
+                        children[parent] = {entry.name for entry in entries if entry.is_dir()}
+                except FileNotFoundError:
+                    pass
+            
             all_exist = True
             for directory in required_dirs:
-                if directory.exists():
-                    print(f"  ✅ {directory.name}: {directory}")
+                if directory.name in children[directory.parent]:
+                    logger.info("  ✅ %s: %s", directory.name, directory)
                 else:
-                    print(f"  ❌ {directory.name}: MISSING")
+                    logger.error("  ❌ %s: MISSING", directory.name)
                     all_exist = False
             
             return all_exist
             
         except Exception as e:
-            print(f"  ❌ Error testing directories: {e}")
+            logger.error("  ❌ Error testing directories: %s", e)
             return False
     
     def test_supabase_config(self) -> bool:
         """Test konfigurasi Supabase"""
         try:
-            print("\n🗄️  Testing Supabase Configuration...")
+            logger.info("🗄️  Testing Supabase Configuration...")
             
             supabase_config = Config.SUPABASE_CONFIG
+            url = supabase_config['url']
+            anon_key = supabase_config['anon_key']
+            service_role_key = supabase_config['service_role_key']
             
-            if not supabase_config['url']:
-                print("  ❌ Supabase URL not configured")
+            if not url:
+                logger.error("  ❌ Supabase URL not configured")
                 return False
             
-            if not supabase_config['anon_key']:
-                print("  ❌ Supabase anon key not configured")
+            if not anon_key:
+                logger.error("  ❌ Supabase anon key not configured")
                 return False
             
-            print(f"  ✅ Supabase URL: {supabase_config['url']}")
-            print(f"  ✅ Anon Key: {supabase_config['anon_key'][:20]}...")
+            logger.info("  ✅ Supabase URL: %s", url)
+            logger.info("  ✅ Anon Key: %s...", anon_key[:20])
             
             # Test basic connection (without actual query)
-            if supabase_config['service_role_key']:
-                print(f"  ✅ Service Role Key: {supabase_config['service_role_key'][:20]}...")
+            if service_role_key:
+                logger.info("  ✅ Service Role Key: %s...", service_role_key[:20])
             else:
-                print("  ⚠️  Service Role Key not configured")
+                logger.warning("  ⚠️  Service Role Key not configured")
             
             return True
             
         except Exception as e:
-            print(f"  ❌ Error testing Supabase config: {e}")
+            logger.error("  ❌ Error testing Supabase config: %s", e)
             return False
     
     def test_web_integration_config(self) -> bool:
         """Test konfigurasi web integration"""
         try:
-            print("\n🌐 Testing Web Integration Configuration...")
+            logger.info("🌐 Testing Web Integration Configuration...")
             
             web_config = Config.WEB_INTEGRATION
             
-            print(f"  🔗 Base URL: {web_config['web_api_base_url']}")
-            print(f"  📤 Upload Endpoint: {web_config['web_upload_endpoint']}")
-            print(f"  📅 Event Endpoint: {web_config['web_event_endpoint']}")
-            print(f"  🎯 Default Type: {web_config['default_event_type']}")
-            print(f"  📋 Default Category: {web_config['default_photo_category']}")
-            print(f"  ⚡ Timeout: {web_config['upload_timeout']}s")
-            print(f"  🔄 Retry Attempts: {web_config['retry_attempts']}")
+            logger.info("  🔗 Base URL: %s", web_config['web_api_base_url'])
+            logger.info("  📤 Upload Endpoint: %s", web_config['web_upload_endpoint'])
+            logger.info("  📅 Event Endpoint: %s", web_config['web_event_endpoint'])
+            logger.info("  🎯 Default Type: %s", web_config['default_event_type'])
+            logger.info("  📋 Default Category: %s", web_config['default_photo_category'])
+            logger.info("  ⚡ Timeout: %ss", web_config['upload_timeout'])
+            logger.info("  🔄 Retry Attempts: %s", web_config['retry_attempts'])
             
             if web_config['jwt_secret']:
-                print(f"  🔐 JWT Secret: {web_config['jwt_secret'][:10]}...")
+                logger.info("  🔐 JWT Secret: %s...", web_config['jwt_secret'][:10])
             else:
-                print("  ❌ JWT Secret not configured")
+                logger.error("  ❌ JWT Secret not configured")
                 return False
             
             return True
             
         except Exception as e:
-            print(f"  ❌ Error testing web integration config: {e}")
+            logger.error("  ❌ Error testing web integration config: %s", e)
             return False
     
     def test_storage_config(self) -> bool:
         """Test konfigurasi cloud storage"""
         try:
-            print("\n☁️  Testing Cloud Storage Configuration...")
+            logger.info("☁️  Testing Cloud Storage Configuration...")
             
             r2_config = Config.CLOUDFLARE_R2_CONFIG
             
@@ -205,41 +226,41 @@ class DatabaseTester:
             ])
             
             if r2_configured:
-                print(f"  ✅ Cloudflare R2 configured")
-                print(f"    - Bucket: {r2_config['bucket_name']}")
-                print(f"    - Public URL: {r2_config['public_url']}")
+                logger.info("  ✅ Cloudflare R2 configured")
+                logger.info("    - Bucket: %s", r2_config['bucket_name'])
+                logger.info("    - Public URL: %s", r2_config['public_url'])
             else:
-                print("  ⚠️  Cloudflare R2 not fully configured")
+                logger.warning("  ⚠️  Cloudflare R2 not fully configured")
             
             return True
             
         except Exception as e:
-            print(f"  ❌ Error testing storage config: {e}")
+            logger.error("  ❌ Error testing storage config: %s", e)
             return False
     
     def test_performance_settings(self) -> bool:
         """Test performance settings untuk hardware"""
         try:
-            print("\n⚡ Testing Performance Settings...")
+            logger.info("⚡ Testing Performance Settings...")
             
             perf_config = Config.PERFORMANCE
             
-            print(f"  👥 Max Workers: {perf_config['max_workers']}")
-            print(f"  💾 Memory Limit: {perf_config['memory_limit_mb']} MB")
-            print(f"  🧹 Temp Cleanup: {perf_config['temp_cleanup']}")
+            logger.info("  👥 Max Workers: %s", perf_config['max_workers'])
+            logger.info("  💾 Memory Limit: %s MB", perf_config['memory_limit_mb'])
+            logger.info("  🧹 Temp Cleanup: %s", perf_config['temp_cleanup'])
             
             # Validasi untuk hardware target (i5-3570, 8GB RAM)
             if perf_config['max_workers'] > 3:
-                print("  ⚠️  Max workers might be too high for i5-3570")
+                logger.warning("  ⚠️  Max workers might be too high for i5-3570")
             
             if perf_config['memory_limit_mb'] > 4096:
-                print("  ⚠️  Memory limit might be too high for 8GB system")
+                logger.warning("  ⚠️  Memory limit might be too high for 8GB system")
             
-            print("  ✅ Performance settings validated for target hardware")
+            logger.info("  ✅ Performance settings validated for target hardware")
             return True
             
         except Exception as e:
-            print(f"  ❌ Error testing performance settings: {e}")
+            logger.error("  ❌ Error testing performance settings: %s", e)
             return False
     
     def run_all_tests(self) -> bool:
@@ -256,18 +277,32 @@ class DatabaseTester:
             ("Performance Settings", self.test_performance_settings)
         ]
         
-        passed = 0
         total = len(tests)
         
-        for test_name, test_func in tests:
+        def run_test(test_name, test_func):
             try:
-                result = test_func()
-                self.test_results[test_name] = result
-                if result:
-                    passed += 1
+                return test_func()
             except Exception as e:
-                print(f"  ❌ Fatal error in {test_name}: {e}")
-                self.test_results[test_name] = False
+                logger.error("  ❌ Fatal error in %s: %s", test_name, e)
+                return False
+        
+        # Test saling independen dan kebanyakan menunggu I/O (stat, env, network), jadi
+        # dijalankan bersamaan; log tiap test ditahan lalu ditulis sesuai urutan daftar
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                executor.submit(run_grouped, run_test, test_name, test_func): test_name
+                for test_name, test_func in tests
+            }
+            for future in as_completed(futures):
+                outcomes[futures[future]] = future.result()
+        
+        for test_name, _ in tests:
+            result, records = outcomes[test_name]
+            write_records(records)
+            self.test_results[test_name] = result
+        
+        passed = sum(1 for result in self.test_results.values() if result)
         
         # Summary
         print(f"\n{'='*50}")
@@ -9,14 +9,18 @@ Test koneksi ke API event, fetch data real, dan interactive selection.
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+# Root proyek (parent dari test/), dihitung sekali dan didahulukan di sys.path
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
 
 import logging
 import time
 import json
 from datetime import datetime
 
+from requests.adapters import HTTPAdapter
+
 # Import modules
 from config import Config
 from event_selector import EventSelector
@@ -31,9 +35,16 @@ class EventTester:
     def __init__(self):
         self.test_results = {}
         self.event_selector = None
+        self._events_cache = None  # Hasil fetch_all_events, dipakai bersama oleh test-test berikutnya
         print("📅 EVENT SELECTION & MANAGEMENT TESTER")
         print("=" * 50)
     
+    def _get_events(self):
+        """Ambil daftar event (satu request API, hasilnya di-cache untuk test lain)"""
+        if self._events_cache is None:
+            self._events_cache = self.event_selector.fetch_all_events()
+        return self._events_cache
+    
     def test_event_selector_init(self) -> bool:
         """Test inisialisasi event selector"""
         try:
@@ -41,6 +52,11 @@ class EventTester:
             
             self.event_selector = EventSelector()
             
+            # Pool koneksi dipakai ulang oleh semua request test ke API event
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=1)
+            self.event_selector.session.mount('https://', adapter)
+            self.event_selector.session.mount('http://', adapter)
+            
             print(f"  ✅ Base URL: {self.event_selector.base_url}")
             print(f"  ✅ Event Endpoint: {self.event_selector.event_endpoint}")
             print(f"  ✅ JWT Secret: {'*' * 10}...")
@@ -94,7 +110,7 @@ class EventTester:
                 return False
             
             print("  🔄 Fetching events from database...")
-            events = self.event_selector.fetch_all_events()
+            events = self._get_events()
             
             if not isinstance(events, list):
                 print(f"  ❌ Expected list, got {type(events)}")
@@ -155,7 +171,7 @@ class EventTester:
                 return False
             
             # Fetch sample events
-            events = self.event_selector.fetch_all_events()
+            events = self._get_events()
             
             if not events:
                 # Create sample event untuk test
@@ -194,7 +210,7 @@ class EventTester:
                 return False
             
             # Fetch events
-            events = self.event_selector.fetch_all_events()
+            events = self._get_events()
             
             if not events:
                 print("  ⚠️  No events to display")
@@ -288,7 +304,7 @@ class EventTester:
                 return False
             
             # Fetch events untuk test
-            events = self.event_selector.fetch_all_events()
+            events = self._get_events()
             
             if not events:
                 print("  ⚠️  No events available for validation test")
@@ -355,9 +371,10 @@ class EventTester:
                 print(f"  ❌ Error handling failed - returned {type(events)}")
                 return False
             
-            # Test normal endpoint lagi
+            # Test normal endpoint lagi (request langsung, bukan dari cache)
             print("  🔍 Testing with restored valid endpoint...")
             events = self.event_selector.fetch_all_events()
+            self._events_cache = None  # Test berikutnya fetch ulang
             
             if isinstance(events, list):
                 print(f"  ✅ Normal operation restored - got {len(events)} events")
@@ -9,14 +9,15 @@ Test deteksi wajah, masking, dan proteksi untuk AI enhancement.
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+# Root proyek (parent dari test/), dihitung sekali dan didahulukan di sys.path
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
 
 import logging
 import time
 import cv2
 import numpy as np
-from pathlib import Path
 from PIL import Image, ImageDraw
 
 # Import modules
@@ -75,7 +76,7 @@ class FaceDetectionTester:
             # === Test Image 1: Simple Face-like Pattern ===
             print("  🎨 Creating simple face pattern...")
             
-            img1 = np.ones((400, 400, 3), dtype=np.uint8) * 200
+            img1 = np.full((400, 400, 3), 200, dtype=np.uint8)
             
             # Face oval
             cv2.ellipse(img1, (200, 180), (60, 80), 0, 0, 360, (220, 190, 170), -1)
@@ -97,7 +98,7 @@ class FaceDetectionTester:
             # === Test Image 2: Multiple Faces ===
             print("  👥 Creating multiple faces pattern...")
             
-            img2 = np.ones((400, 600, 3), dtype=np.uint8) * 180
+            img2 = np.full((400, 600, 3), 180, dtype=np.uint8)
             
             # Face 1
             cv2.ellipse(img2, (150, 150), (50, 70), 0, 0, 360, (220, 190, 170), -1)
@@ -118,7 +119,7 @@ class FaceDetectionTester:
             # === Test Image 3: No Face ===
             print("  🌆 Creating no-face landscape...")
             
-            img3 = np.ones((300, 500, 3), dtype=np.uint8) * 100
+            img3 = np.full((300, 500, 3), 100, dtype=np.uint8)
             
             # Landscape elements
             cv2.rectangle(img3, (0, 200), (500, 300), (34, 139, 34), -1)  # Ground
@@ -134,7 +135,7 @@ class FaceDetectionTester:
             # === Test Image 4: Complex Scene dengan Face ===
             print("  🏞️  Creating complex scene with face...")
             
-            img4 = np.ones((500, 700, 3), dtype=np.uint8) * 150
+            img4 = np.full((500, 700, 3), 150, dtype=np.uint8)
             
             # Background
             cv2.rectangle(img4, (0, 0), (700, 500), (120, 150, 180), -1)
@@ -478,13 +479,13 @@ class FaceDetectionTester:
             
             # Test 1: Very small image
             print("  📏 Testing very small image...")
-            small_img = np.ones((50, 50, 3), dtype=np.uint8) * 128
+            small_img = np.full((50, 50, 3), 128, dtype=np.uint8)
             faces = self.face_detector.detect_faces(small_img)
             print(f"    50x50 image: {len(faces)} faces detected")
             
             # Test 2: Very large image
             print("  📏 Testing large image...")
-            large_img = np.ones((2000, 2000, 3), dtype=np.uint8) * 128
+            large_img = np.full((2000, 2000, 3), 128, dtype=np.uint8)
             start_time = time.time()
             faces = self.face_detector.detect_faces(large_img)
             large_time = time.time() - start_time
@@ -9,14 +9,15 @@ Test upload foto ke web project, koneksi API, dan integrasi dengan database.
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+# Root proyek (parent dari test/), dihitung sekali dan didahulukan di sys.path
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
 
 import logging
 import time
 import json
 import requests
-from pathlib import Path
 from PIL import Image
 import io
 